@@ -0,0 +1,11 @@
+"""ANSI escape sequences shared by the console messages of the ACI module."""
+
+RED = "\033[31;1m"
+GREEN = "\033[32;1m"
+WHITE = "\033[37;1m"
+YELLOW = "\033[33;1m"
+MAGENTA = "\033[35;1m"
+CYAN = "\033[36;1m"
+RESET = "\033[0m"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
@@ -9,55 +9,538 @@
 """ACI module configuration for the ACI Python SDK (cobra)."""
 
 import json
+import sys
+from xml.etree import ElementTree
 import urllib3
 import cobra.mit.session
 import cobra.mit.access
 import cobra.mit.request
-import cobra.model.aaa
-import cobra.model.ep
-import cobra.model.geo
-import cobra.model.coop
-import cobra.model.ctrlr
-import cobra.model.fv
-import cobra.model.l3ext
-import cobra.model.l2ext
-import cobra.model.ospf
-import cobra.model.infra
-import cobra.model.dhcp
-import cobra.model.fabric
-import cobra.model.datetime
-import cobra.model.snmp
-import cobra.model.comm
-import cobra.model.cdp
-import cobra.model.lldp
-import cobra.model.lacp
-import cobra.model.stp
-import cobra.model.stormctrl
-import cobra.model.mcp
-import cobra.model.pol
-import cobra.model.fvns
-import cobra.model.phys
-import cobra.model.qos
-import cobra.model.bgp
-import cobra.model.pki
-import cobra.model.isis
-import cobra.model.latency
-import cobra.model.infrazone
-import cobra.model.mgmt
-import cobra.model.vz
-import cobra.model.pim
-import cobra.model.igmp
+from cobra.model.aaa import FabricSec as AaaFabricSec, PreLoginBanner as AaaPreLoginBanner, UserEp as AaaUserEp
+from cobra.model.bgp import AsP as BgpAsP, ExtRRP as BgpExtRRP, InstPol as BgpInstPol, RRNodePEp as BgpRRNodePEp, RRP as BgpRRP
+from cobra.model.cdp import IfPol as CdpIfPol
+from cobra.model.comm import Http as CommHttp, Https as CommHttps, Pol as CommPol, Shellinabox as CommShellinabox, Ssh as CommSsh, Telnet as CommTelnet
+from cobra.model.coop import Pol as CoopPol
+from cobra.model.ctrlr import Inst as CtrlrInst
+from cobra.model.datetime import (
+    Format as DatetimeFormat,
+    NtpAuthKey as DatetimeNtpAuthKey,
+    NtpProv as DatetimeNtpProv,
+    Pol as DatetimePol,
+    RsNtpProvToEpg as DatetimeRsNtpProvToEpg,
+    RsNtpProvToNtpAuthKey as DatetimeRsNtpProvToNtpAuthKey,
+)
+from cobra.model.ep import ControlP as EpControlP, IpAgingP as EpIpAgingP, LoopProtectP as EpLoopProtectP
+from cobra.model.fabric import (
+    ExplicitGEp as FabricExplicitGEp,
+    FuncP as FabricFuncP,
+    HIfPol as FabricHIfPol,
+    Inst as FabricInst,
+    NodeControl as FabricNodeControl,
+    NodeIdentP as FabricNodeIdentP,
+    NodeIdentPol as FabricNodeIdentPol,
+    NodePEp as FabricNodePEp,
+    OOServicePol as FabricOOServicePol,
+    PodBlk as FabricPodBlk,
+    PodP as FabricPodP,
+    PodPGrp as FabricPodPGrp,
+    PodS as FabricPodS,
+    ProtPol as FabricProtPol,
+    RsCommPol as FabricRsCommPol,
+    RsMacsecPol as FabricRsMacsecPol,
+    RsOosPath as FabricRsOosPath,
+    RsPodPGrp as FabricRsPodPGrp,
+    RsPodPGrpBGPRRP as FabricRsPodPGrpBGPRRP,
+    RsPodPGrpCoopP as FabricRsPodPGrpCoopP,
+    RsPodPGrpIsisDomP as FabricRsPodPGrpIsisDomP,
+    RsSnmpPol as FabricRsSnmpPol,
+    RsTimePol as FabricRsTimePol,
+    RsVpcInstPol as FabricRsVpcInstPol,
+    RtPodPGrp as FabricRtPodPGrp,
+    SetupP as FabricSetupP,
+    SetupPol as FabricSetupPol,
+)
+from cobra.model.fv import (
+    AEPg as FvAEPg,
+    Ap as FvAp,
+    BD as FvBD,
+    Ctx as FvCtx,
+    RsBd as FvRsBd,
+    RsBdToEpRet as FvRsBdToEpRet,
+    RsBDToOut as FvRsBDToOut,
+    RsBgpCtxPol as FvRsBgpCtxPol,
+    RsCtx as FvRsCtx,
+    RsCtxToEpRet as FvRsCtxToEpRet,
+    RsCtxToExtRouteTagPol as FvRsCtxToExtRouteTagPol,
+    RsDomAtt as FvRsDomAtt,
+    RsIgmpsn as FvRsIgmpsn,
+    RsMldsn as FvRsMldsn,
+    RsOspfCtxPol as FvRsOspfCtxPol,
+    RsPathAtt as FvRsPathAtt,
+    RsVrfValidationPol as FvRsVrfValidationPol,
+    Subnet as FvSubnet,
+    Tenant as FvTenant,
+)
+from cobra.model.fvns import AddrInst as FvnsAddrInst, EncapBlk as FvnsEncapBlk, UcastAddrBlk as FvnsUcastAddrBlk, VlanInstP as FvnsVlanInstP
+from cobra.model.geo import Building as GeoBuilding, Floor as GeoFloor, Rack as GeoRack, Room as GeoRoom, Row as GeoRow, RsNodeLocation as GeoRsNodeLocation, Site as GeoSite
+from cobra.model.igmp import IfP as IgmpIfP
+from cobra.model.infra import (
+    AccBndlGrp as InfraAccBndlGrp,
+    AccNodePGrp as InfraAccNodePGrp,
+    AccPortGrp as InfraAccPortGrp,
+    AccPortP as InfraAccPortP,
+    AttEntityP as InfraAttEntityP,
+    FexBndlGrp as InfraFexBndlGrp,
+    FexP as InfraFexP,
+    FuncP as InfraFuncP,
+    HPortS as InfraHPortS,
+    Infra as InfraInfra,
+    LeafS as InfraLeafS,
+    NodeBlk as InfraNodeBlk,
+    NodeP as InfraNodeP,
+    PortBlk as InfraPortBlk,
+    PortTrackPol as InfraPortTrackPol,
+    RsAccBaseGrp as InfraRsAccBaseGrp,
+    RsAccNodePGrp as InfraRsAccNodePGrp,
+    RsAccPortP as InfraRsAccPortP,
+    RsAttEntP as InfraRsAttEntP,
+    RsBfdIpv4InstPol as InfraRsBfdIpv4InstPol,
+    RsBfdIpv6InstPol as InfraRsBfdIpv6InstPol,
+    RsBfdMhIpv4InstPol as InfraRsBfdMhIpv4InstPol,
+    RsBfdMhIpv6InstPol as InfraRsBfdMhIpv6InstPol,
+    RsCdpIfPol as InfraRsCdpIfPol,
+    RsCoppIfPol as InfraRsCoppIfPol,
+    RsDomP as InfraRsDomP,
+    RsDwdmIfPol as InfraRsDwdmIfPol,
+    RsEquipmentFlashConfigPol as InfraRsEquipmentFlashConfigPol,
+    RsFcFabricPol as InfraRsFcFabricPol,
+    RsFcIfPol as InfraRsFcIfPol,
+    RsFcInstPol as InfraRsFcInstPol,
+    RsHIfPol as InfraRsHIfPol,
+    RsIaclLeafProfile as InfraRsIaclLeafProfile,
+    RsIaclSpineProfile as InfraRsIaclSpineProfile,
+    RsL2IfPol as InfraRsL2IfPol,
+    RsL2NodeAuthPol as InfraRsL2NodeAuthPol,
+    RsL2PortAuthPol as InfraRsL2PortAuthPol,
+    RsL2PortSecurityPol as InfraRsL2PortSecurityPol,
+    RsLacpPol as InfraRsLacpPol,
+    RsLeafCoppProfile as InfraRsLeafCoppProfile,
+    RsLeafPGrpToCdpIfPol as InfraRsLeafPGrpToCdpIfPol,
+    RsLeafPGrpToLldpIfPol as InfraRsLeafPGrpToLldpIfPol,
+    RsLeafTopoctrlUsbConfigProfilePol as InfraRsLeafTopoctrlUsbConfigProfilePol,
+    RsLinkFlapPol as InfraRsLinkFlapPol,
+    RsLldpIfPol as InfraRsLldpIfPol,
+    RsMacsecIfPol as InfraRsMacsecIfPol,
+    RsMcpIfPol as InfraRsMcpIfPol,
+    RsMonIfInfraPol as InfraRsMonIfInfraPol,
+    RsMonNodeInfraPol as InfraRsMonNodeInfraPol,
+    RsMstInstPol as InfraRsMstInstPol,
+    RsPoeInstPol as InfraRsPoeInstPol,
+    RsQosDppIfPol as InfraRsQosDppIfPol,
+    RsQosEgressDppIfPol as InfraRsQosEgressDppIfPol,
+    RsQosIngressDppIfPol as InfraRsQosIngressDppIfPol,
+    RsQosLlfcIfPol as InfraRsQosLlfcIfPol,
+    RsQosPfcIfPol as InfraRsQosPfcIfPol,
+    RsQosSdIfPol as InfraRsQosSdIfPol,
+    RsSpAccGrp as InfraRsSpAccGrp,
+    RsSpAccPortP as InfraRsSpAccPortP,
+    RsSpineAccNodePGrp as InfraRsSpineAccNodePGrp,
+    RsSpineBfdIpv4InstPol as InfraRsSpineBfdIpv4InstPol,
+    RsSpineBfdIpv6InstPol as InfraRsSpineBfdIpv6InstPol,
+    RsSpineCoppProfile as InfraRsSpineCoppProfile,
+    RsSpinePGrpToCdpIfPol as InfraRsSpinePGrpToCdpIfPol,
+    RsSpinePGrpToLldpIfPol as InfraRsSpinePGrpToLldpIfPol,
+    RsStormctrlIfPol as InfraRsStormctrlIfPol,
+    RsStpIfPol as InfraRsStpIfPol,
+    RsSynceInstPol as InfraRsSynceInstPol,
+    RsTopoctrlFastLinkFailoverInstPol as InfraRsTopoctrlFastLinkFailoverInstPol,
+    RsTopoctrlFwdScaleProfPol as InfraRsTopoctrlFwdScaleProfPol,
+    RsVlanNs as InfraRsVlanNs,
+    SetPol as InfraSetPol,
+    SHPortS as InfraSHPortS,
+    SpAccPortGrp as InfraSpAccPortGrp,
+    SpAccPortP as InfraSpAccPortP,
+    SpineAccNodePGrp as InfraSpineAccNodePGrp,
+    SpineP as InfraSpineP,
+    SpineS as InfraSpineS,
+)
+from cobra.model.infrazone import Zone as InfrazoneZone, ZoneP as InfrazoneZoneP
+from cobra.model.isis import DomPol as IsisDomPol
+from cobra.model.l2ext import DomP as L2extDomP
+from cobra.model.l3ext import (
+    DomP as L3extDomP,
+    LIfP as L3extLIfP,
+    LNodeP as L3extLNodeP,
+    Out as L3extOut,
+    RsEctx as L3extRsEctx,
+    RsL3DomAtt as L3extRsL3DomAtt,
+    RsNodeL3OutAtt as L3extRsNodeL3OutAtt,
+    RsPathL3OutAtt as L3extRsPathL3OutAtt,
+)
+from cobra.model.lacp import LagPol as LacpLagPol
+from cobra.model.latency import PtpMode as LatencyPtpMode
+from cobra.model.lldp import IfPol as LldpIfPol
+from cobra.model.mcp import IfPol as McpIfPol, InstPol as McpInstPol
+from cobra.model.mgmt import (
+    Grp as MgmtGrp,
+    InBZone as MgmtInBZone,
+    NodeGrp as MgmtNodeGrp,
+    OoBZone as MgmtOoBZone,
+    RsAddrInst as MgmtRsAddrInst,
+    RsGrp as MgmtRsGrp,
+    RsInB as MgmtRsInB,
+    RsOoB as MgmtRsOoB,
+)
+from cobra.model.ospf import ExtP as OspfExtP
+from cobra.model.phys import DomP as PhysDomP
+from cobra.model.pim import CtxP as PimCtxP
+from cobra.model.pki import ExportEncryptionKey as PkiExportEncryptionKey
+from cobra.model.pol import Uni as PolUni
+from cobra.model.qos import PfcIfPol as QosPfcIfPol
+from cobra.model.snmp import (
+    ClientGrpP as SnmpClientGrpP,
+    ClientP as SnmpClientP,
+    CommunityP as SnmpCommunityP,
+    Pol as SnmpPol,
+    RsEpg as SnmpRsEpg,
+    TrapFwdServerP as SnmpTrapFwdServerP,
+    UserP as SnmpUserP,
+)
+from cobra.model.stormctrl import IfPol as StormctrlIfPol
+from cobra.model.stp import IfPol as StpIfPol
+from cobra.model.vz import Any as VzAny, RsAnyToCons as VzRsAnyToCons, RsAnyToProv as VzRsAnyToProv
 
 from typing import Optional
 from datetime import datetime
+from collections import deque
+from types import MappingProxyType
 from typing import Mapping, Iterable, Any
 from math import isnan
+from functools import lru_cache
 from .jinja import JinjaResult
+from ._ansi import RED, GREEN, YELLOW, RESET
 
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+# ------------------------------------------   Console Messages
+
+
+_OK_FMT = f"{YELLOW}[Cobra]:{GREEN} Class %s was rendered successfully.{RESET}\n"
+_ERR_FMT = f"{YELLOW}[Cobra] -> [%s]:{RED} Class %s failed, %s{RESET}\n"
+_MISSING_FMT = f"{YELLOW}[Cobra] -> [ConfigError]::{RED} Class %s does not exist.{RESET}\n"
+_EMPTY_MSG = f"{YELLOW}[Cobra] -> [ConfigError]:{RED} No object was found in configuration.{RESET} \n"
+
+
+# ------------------------------------------   Validators
+
+
+_MISSING = object()
+
+# Every casing of "nan", so string checks need no lowered copy
+_NAN_FORMS = frozenset(("nan", "naN", "nAn", "nAN", "Nan", "NaN", "NAn", "NAN"))
+
+
+def _is_invalid(v: Any) -> bool:
+    """
+    Return True for the values not_nan_str() rejects: None, blank or "nan" strings and float NaN
+    """
+    if v is None:
+        return True
+    if isinstance(v, str):
+        if v and not v[0].isspace() and not v[-1].isspace():
+            return v in _NAN_FORMS
+        v = v.strip()
+        return not v or v in _NAN_FORMS
+    if isinstance(v, float):
+        return isnan(v)
+    return False
+
+
+def _always_valid(value: Mapping[str, Any]) -> bool:
+    return True
+
+
+@lru_cache(maxsize=None)
+def _make_validator(keys: tuple):
+    """
+    Build a predicate equivalent to not_nan_str(value, keys), with the keys bound once
+    """
+    if not keys:
+        return _always_valid
+    if len(keys) == 1:
+        key = keys[0]
+
+        def validator(value: Mapping[str, Any]) -> bool:
+            v = value.get(key, _MISSING)
+            return v is _MISSING or not _is_invalid(v)
+
+        return validator
+
+    def validator(value: Mapping[str, Any]) -> bool:
+        for key in keys:
+            v = value.get(key, _MISSING)
+            if v is not _MISSING and _is_invalid(v):
+                return False
+        return True
+
+    return validator
+
+
+def _props(item: Mapping[str, Any]) -> dict:
+    """
+    Return the MO properties of an item, leaving out its nested child lists and dicts
+    """
+    return {k: v for k, v in item.items() if not isinstance(v, (list, dict))}
+
+
+def _valid_children(parent: Mapping[str, Any], key: str, keys: tuple):
+    """
+    Yield the children listed under parent[key] that pass not_nan_str(child, keys)
+    """
+    items = parent.get(key)
+    if not items:
+        return
+    valid = _make_validator(keys)
+    for item in items:
+        if valid(item):
+            yield item
+
+
+def _rule(cls, keys: tuple = (), singles: tuple = (), lists: tuple = ()) -> tuple:
+    """
+    Describe how _build_tree() creates an MO: its class, the keys validated on it and its (key, rule) children
+    """
+    return (cls, _make_validator(keys), singles, lists)
+
+
+# ------------------------------------------   Cobra Rules
+
+
+# Child tables as (key, class, validator), single children first and then lists of children
+_RULES_FVAEPG = (("fvRsBd", FvRsBd, _make_validator(("tnFvBDName",))),)
+
+_RULES_FVAEPG_CHILDREN = (
+    ("fvRsDomAtt", FvRsDomAtt, _make_validator(("tDn",))),
+    ("fvRsPathAtt", FvRsPathAtt, _make_validator(("tDn", "primaryEncap", "mode"))),
+)
+
+_RULES_FVBD = (
+    ("fvRsCtx", FvRsCtx, _make_validator(("tnFvCtxName",))),
+    ("igmpIfP", IgmpIfP, _make_validator(("name",))),
+    ("fvRsBdToEpRet", FvRsBdToEpRet, _make_validator(("tnFvEpRetPolName",))),
+    ("fvRsIgmpsn", FvRsIgmpsn, _make_validator(("tnIgmpSnoopPolName",))),
+    ("fvRsMldsn", FvRsMldsn, _make_validator(("tnMldSnoopPolName",))),
+    ("fvRsBDToOut", FvRsBDToOut, _make_validator(("tnL3extOutName",))),
+)
+
+_RULES_FVBD_CHILDREN = (("fvSubnet", FvSubnet, _make_validator(("ip",))),)
+
+_RULES_FVCTX = (
+    ("fvRsCtxToEpRet", FvRsCtxToEpRet, _make_validator(("tnFvEpRetPolName",))),
+    ("fvRsCtxToExtRouteTagPol", FvRsCtxToExtRouteTagPol, _make_validator(("tnL3extRouteTagPolName",))),
+    ("fvRsOspfCtxPol", FvRsOspfCtxPol, _make_validator(("tnOspfCtxPolName",))),
+    ("fvRsBgpCtxPol", FvRsBgpCtxPol, _make_validator(("tnBgpCtxPolName",))),
+    ("fvRsVrfValidationPol", FvRsVrfValidationPol, _make_validator(("tnL3extVrfValidationPolName",))),
+    ("pimCtxP", PimCtxP, _make_validator(("mtu",))),
+)
+
+_RULES_VZANY_CHILDREN = (
+    ("vzRsAnyToProv", VzRsAnyToProv, _make_validator(("tnVzBrCPName",))),
+    ("vzRsAnyToCons", VzRsAnyToCons, _make_validator(("tnVzBrCPName",))),
+)
+
+_RULES_COMMPOL = MappingProxyType(
+    {
+        "commTelnet": (CommTelnet, _make_validator(("name", "adminSt"))),
+        "commSsh": (CommSsh, _make_validator(("name", "adminSt"))),
+        "commHttp": (CommHttp, _make_validator(("name", "adminSt"))),
+        "commHttps": (CommHttps, _make_validator(("name", "adminSt"))),
+        "commShellinabox": (CommShellinabox, _make_validator(("name", "adminSt"))),
+    }
+)
+
+_RULES_INFRAACCNODEPGRP = MappingProxyType(
+    {
+        "infraRsTopoctrlFwdScaleProfPol": (InfraRsTopoctrlFwdScaleProfPol, _make_validator(("tnTopoctrlFwdScaleProfilePolName",))),
+        "infraRsLeafTopoctrlUsbConfigProfilePol": (InfraRsLeafTopoctrlUsbConfigProfilePol, _make_validator(("tnTopoctrlUsbConfigProfilePolName",))),
+        "infraRsLeafPGrpToLldpIfPol": (InfraRsLeafPGrpToLldpIfPol, _make_validator(("tnLldpIfPolName",))),
+        "infraRsBfdIpv6InstPol": (InfraRsBfdIpv6InstPol, _make_validator(("tnBfdIpv6InstPolName",))),
+        "infraRsSynceInstPol": (InfraRsSynceInstPol, _make_validator(("tnSynceInstPolName",))),
+        "infraRsPoeInstPol": (InfraRsPoeInstPol, _make_validator(("tnPoeInstPolName",))),
+        "infraRsBfdMhIpv4InstPol": (InfraRsBfdMhIpv4InstPol, _make_validator(("tnBfdMhIpv4InstPolName",))),
+        "infraRsBfdMhIpv6InstPol": (InfraRsBfdMhIpv6InstPol, _make_validator(("tnBfdMhIpv6InstPolName",))),
+        "infraRsEquipmentFlashConfigPol": (InfraRsEquipmentFlashConfigPol, _make_validator(("tnEquipmentFlashConfigPolName",))),
+        "infraRsMonNodeInfraPol": (InfraRsMonNodeInfraPol, _make_validator(("tnMonInfraPolName",))),
+        "infraRsFcInstPol": (InfraRsFcInstPol, _make_validator(("tnFcInstPolName",))),
+        "infraRsTopoctrlFastLinkFailoverInstPol": (InfraRsTopoctrlFastLinkFailoverInstPol, _make_validator(("tnTopoctrlFastLinkFailoverInstPolName",))),
+        "infraRsMstInstPol": (InfraRsMstInstPol, _make_validator(("tnStpInstPolName",))),
+        "infraRsFcFabricPol": (InfraRsFcFabricPol, _make_validator(("tnFcFabricPolName",))),
+        "infraRsLeafCoppProfile": (InfraRsLeafCoppProfile, _make_validator(("tnCoppLeafProfileName",))),
+        "infraRsIaclLeafProfile": (InfraRsIaclLeafProfile, _make_validator(("tnIaclLeafProfileName",))),
+        "infraRsBfdIpv4InstPol": (InfraRsBfdIpv4InstPol, _make_validator(("tnBfdIpv4InstPolName",))),
+        "infraRsL2NodeAuthPol": (InfraRsL2NodeAuthPol, _make_validator(("tnL2NodeAuthPolName",))),
+        "infraRsLeafPGrpToCdpIfPol": (InfraRsLeafPGrpToCdpIfPol, _make_validator(("tnCdpIfPolName",))),
+    }
+)
+
+# An empty key tuple adds the child without validation, as these handlers always did
+_RULES_INFRASPINEACCNODEPGRP = MappingProxyType(
+    {
+        "infraRsSpineCoppProfile": (InfraRsSpineCoppProfile, _make_validator(())),
+        "infraRsSpineBfdIpv4InstPol": (InfraRsSpineBfdIpv4InstPol, _make_validator(())),
+        "infraRsSpineBfdIpv6InstPol": (InfraRsSpineBfdIpv6InstPol, _make_validator(())),
+        "infraRsIaclSpineProfile": (InfraRsIaclSpineProfile, _make_validator(())),
+        "infraRsSpinePGrpToCdpIfPol": (InfraRsSpinePGrpToCdpIfPol, _make_validator(())),
+        "infraRsSpinePGrpToLldpIfPol": (InfraRsSpinePGrpToLldpIfPol, _make_validator(())),
+    }
+)
+
+_RULES_INFRASPACCPORTP = _rule(
+    InfraSpAccPortP,
+    lists=(
+        (
+            "infraSHPortS",
+            _rule(
+                InfraSHPortS,
+                singles=(("infraRsSpAccGrp", _rule(InfraRsSpAccGrp)),),
+                lists=(("infraPortBlk", _rule(InfraPortBlk)),),
+            ),
+        ),
+    ),
+)
+
+_RULES_INFRASPACCPORTGRP = MappingProxyType(
+    {
+        "infraRsHIfPol": (InfraRsHIfPol, _make_validator(())),
+        "infraRsCdpIfPol": (InfraRsCdpIfPol, _make_validator(())),
+        "infraRsMacsecIfPol": (InfraRsMacsecIfPol, _make_validator(())),
+        "infraRsAttEntP": (InfraRsAttEntP, _make_validator(())),
+        "infraRsLinkFlapPol": (InfraRsLinkFlapPol, _make_validator(())),
+        "infraRsCoppIfPol": (InfraRsCoppIfPol, _make_validator(())),
+    }
+)
+
+_RULES_INFRAACCPORTP = _rule(
+    InfraAccPortP,
+    lists=(
+        (
+            "infraHPortS",
+            _rule(
+                InfraHPortS,
+                singles=(("infraRsAccBaseGrp", _rule(InfraRsAccBaseGrp, ("tDn",))),),
+                lists=(("infraPortBlk", _rule(InfraPortBlk, ("fromPort",))),),
+            ),
+        ),
+    ),
+)
+
+_RULES_INFRAFEXP = _rule(
+    InfraFexP,
+    singles=(("infraFexBndlGrp", _rule(InfraFexBndlGrp)),),
+    lists=(
+        (
+            "infraHPortS",
+            _rule(
+                InfraHPortS,
+                singles=(("infraRsAccBaseGrp", _rule(InfraRsAccBaseGrp)),),
+                lists=(("infraPortBlk", _rule(InfraPortBlk)),),
+            ),
+        ),
+    ),
+)
+
+_RULES_INFRAACCPORTGRP = MappingProxyType(
+    {
+        "infraRsAttEntP": (InfraRsAttEntP, _make_validator(("tDn",))),
+        "infraRsStpIfPol": (InfraRsStpIfPol, _make_validator(("tnStpIfPolName",))),
+        "infraRsQosLlfcIfPol": (InfraRsQosLlfcIfPol, _make_validator(("tnQosLlfcIfPolName",))),
+        "infraRsQosIngressDppIfPol": (InfraRsQosIngressDppIfPol, _make_validator(("tnQosDppPolName",))),
+        "infraRsStormctrlIfPol": (InfraRsStormctrlIfPol, _make_validator(("tnStormctrlIfPolName",))),
+        "infraRsQosEgressDppIfPol": (InfraRsQosEgressDppIfPol, _make_validator(("tnQosDppPolName",))),
+        "infraRsMonIfInfraPol": (InfraRsMonIfInfraPol, _make_validator(("tnMonInfraPolName",))),
+        "infraRsMcpIfPol": (InfraRsMcpIfPol, _make_validator(("tnMcpIfPolName",))),
+        "infraRsMacsecIfPol": (InfraRsMacsecIfPol, _make_validator(("tnMacsecIfPolName",))),
+        "infraRsQosSdIfPol": (InfraRsQosSdIfPol, _make_validator(("tnQosSdIfPolName",))),
+        "infraRsCdpIfPol": (InfraRsCdpIfPol, _make_validator(("tnCdpIfPolName",))),
+        "infraRsL2IfPol": (InfraRsL2IfPol, _make_validator(("tnL2IfPolName",))),
+        "infraRsQosDppIfPol": (InfraRsQosDppIfPol, _make_validator(("tnQosDppPolName",))),
+        "infraRsCoppIfPol": (InfraRsCoppIfPol, _make_validator(("tnCoppIfPolName",))),
+        "infraRsDwdmIfPol": (InfraRsDwdmIfPol, _make_validator(("tnDwdmIfPolName",))),
+        "infraRsLinkFlapPol": (InfraRsLinkFlapPol, _make_validator(("tnFabricLinkFlapPolName",))),
+        "infraRsLldpIfPol": (InfraRsLldpIfPol, _make_validator(("tnLldpIfPolName",))),
+        "infraRsFcIfPol": (InfraRsFcIfPol, _make_validator(("tnFcIfPolName",))),
+        "infraRsQosPfcIfPol": (InfraRsQosPfcIfPol, _make_validator(("tnQosPfcIfPolName",))),
+        "infraRsHIfPol": (InfraRsHIfPol, _make_validator(("tnFabricHIfPolName",))),
+        "infraRsL2PortSecurityPol": (InfraRsL2PortSecurityPol, _make_validator(("tnL2PortSecurityPolName",))),
+        "infraRsL2PortAuthPol": (InfraRsL2PortAuthPol, _make_validator(("tnL2PortAuthPolName",))),
+    }
+)
+
+_RULES_INFRAACCBNDLGRP = MappingProxyType(
+    {
+        "infraRsAttEntP": (InfraRsAttEntP, _make_validator(("tDn",))),
+        "infraRsStpIfPol": (InfraRsStpIfPol, _make_validator(("tnStpIfPolName",))),
+        "infraRsQosLlfcIfPol": (InfraRsQosLlfcIfPol, _make_validator(("tnQosLlfcIfPolName",))),
+        "infraRsQosIngressDppIfPol": (InfraRsQosIngressDppIfPol, _make_validator(("tnQosDppPolName",))),
+        "infraRsStormctrlIfPol": (InfraRsStormctrlIfPol, _make_validator(("tnStormctrlIfPolName",))),
+        "infraRsQosEgressDppIfPol": (InfraRsQosEgressDppIfPol, _make_validator(("tnQosDppPolName",))),
+        "infraRsMonIfInfraPol": (InfraRsMonIfInfraPol, _make_validator(("tnMonInfraPolName",))),
+        "infraRsMcpIfPol": (InfraRsMcpIfPol, _make_validator(("tnMcpIfPolName",))),
+        "infraRsMacsecIfPol": (InfraRsMacsecIfPol, _make_validator(("tnMacsecIfPolName",))),
+        "infraRsQosSdIfPol": (InfraRsQosSdIfPol, _make_validator(("tnQosSdIfPolName",))),
+        "infraRsCdpIfPol": (InfraRsCdpIfPol, _make_validator(("tnCdpIfPolName",))),
+        "infraRsL2IfPol": (InfraRsL2IfPol, _make_validator(("tnL2IfPolName",))),
+        "infraRsQosDppIfPol": (InfraRsQosDppIfPol, _make_validator(("tnQosDppPolName",))),
+        "infraRsCoppIfPol": (InfraRsCoppIfPol, _make_validator(("tnCoppIfPolName",))),
+        "infraRsLldpIfPol": (InfraRsLldpIfPol, _make_validator(("tnLldpIfPolName",))),
+        "infraRsFcIfPol": (InfraRsFcIfPol, _make_validator(("tnFcIfPolName",))),
+        "infraRsQosPfcIfPol": (InfraRsQosPfcIfPol, _make_validator(("tnQosPfcIfPolName",))),
+        "infraRsHIfPol": (InfraRsHIfPol, _make_validator(("tnFabricHIfPolName",))),
+        "infraRsL2PortSecurityPol": (InfraRsL2PortSecurityPol, _make_validator(("tnL2PortSecurityPolName",))),
+        "infraRsL2PortAuthPol": (InfraRsL2PortAuthPol, _make_validator(("tnL2PortAuthPolName",))),
+        "infraRsLacpPol": (InfraRsLacpPol, _make_validator(("tnLacpLagPolName",))),
+        "infraRsLinkFlapPol": (InfraRsLinkFlapPol, _make_validator(("tnFabricLinkFlapPolName",))),
+    }
+)
+
+_RULES_GEOSITE = _rule(
+    GeoSite,
+    lists=(
+        (
+            "geoBuilding",
+            _rule(
+                GeoBuilding,
+                lists=(
+                    (
+                        "geoFloor",
+                        _rule(
+                            GeoFloor,
+                            lists=(
+                                (
+                                    "geoRoom",
+                                    _rule(
+                                        GeoRoom,
+                                        lists=(
+                                            (
+                                                "geoRow",
+                                                _rule(
+                                                    GeoRow,
+                                                    lists=(("geoRack", _rule(GeoRack, ("name",), lists=(("geoRsNodeLocation", _rule(GeoRsNodeLocation, ("tDn",))),))),),
+                                                ),
+                                            ),
+                                        ),
+                                    ),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+    ),
+)
+
 # ------------------------------------------   ACI Error Class
 
 
@@ -83,12 +566,22 @@ class CobraResult:
     """
 
     def __init__(self):
-        self.date = datetime.now().strftime("%d/%m/%Y-%H:%M:%S")
+        self._created = datetime.now()
+        self._date = None
         self._config = None
+        self._json = None
+        self._pretty_xml = None
+        self._input_json = None
         self._success = False
-        self._log = []
+        self._log = deque()
         self.path = None
 
+    @property
+    def date(self) -> str:
+        if self._date is None:
+            self._date = self._created.strftime("%d/%m/%Y-%H:%M:%S")
+        return self._date
+
     @property
     def config(self) -> Optional[cobra.mit.request.ConfigRequest]:
         return self._config
@@ -98,8 +591,28 @@ class CobraResult:
         return self._config.xmldata if self._config else None
 
     @property
-    def json(self) -> bool:
-        return json.loads(self._config.data) if self._config else None
+    def json(self) -> Optional[dict]:
+        if self._json is None and self._config:
+            self._json = json.loads(self._config.data)
+        return self._json
+
+    @property
+    def pretty_xml(self) -> Optional[str]:
+        """
+        Tab-indented XML document, serialised once and reused by every later save or print
+        """
+        if self._pretty_xml is None and self._config:
+            root = ElementTree.fromstring(self._config.xmldata)
+            ElementTree.indent(root, space="\t")
+            self._pretty_xml = ElementTree.tostring(root, encoding="unicode", xml_declaration=True)
+        return self._pretty_xml
+
+    @property
+    def input_json(self) -> Optional[dict]:
+        """
+        Already decoded Jinja output the configuration was built from
+        """
+        return self._input_json
 
     @property
     def success(self) -> bool:
@@ -107,7 +620,7 @@ class CobraResult:
 
     @property
     def log(self) -> list:
-        return self._log
+        return list(self._log)
 
     @property
     def output(self) -> dict:
@@ -117,7 +630,7 @@ class CobraResult:
                 "json": self.json,
                 "xml": self.xml,
                 "success": self._success,
-                "log": self._log,
+                "log": list(self._log),
             }
         ]
 
@@ -125,13 +638,25 @@ class CobraResult:
     def success(self, value):
         self._success = value
 
+    @input_json.setter
+    def input_json(self, value):
+        self._input_json = value
+
     @log.setter
     def log(self, value):
+        """
+        Kept for backwards compatibility, assigning a message appends it to the log
+        """
+        self._log.append(value)
+
+    def log_append(self, value) -> None:
         self._log.append(value)
 
     @config.setter
     def config(self, value):
         self._config = value
+        self._json = None
+        self._pretty_xml = None
 
     def __str__(self):
         return "CobraResult"
@@ -145,16 +670,22 @@ class CobraClass:
     Mo class from Cobra SDK
     """
 
-    def __init__(self):
+    __slots__ = ("__root", "__uni", "__tenant_cache", "__ap_cache", "__parents", "config", "_result", "_verbose")
+
+    def __init__(self, verbose: bool = True):
         # --------------   ACI Information
         self.__root = ""
-        self.__uni = cobra.model.pol.Uni(self.__root)
+        self.__uni = PolUni(self.__root)
+        self.__tenant_cache = {}
+        self.__ap_cache = {}
+        self.__parents = {}
         # self.__uni.setConfigZone("PROD")
         self.config = cobra.mit.request.ConfigRequest()
 
         # --------------   Output Information
 
         self._result = CobraResult()
+        self._verbose = verbose
 
     # -------------------------------------------------   Control
 
@@ -169,128 +700,232 @@ class CobraClass:
         Only executes methods with non-empty values.
         Successful executions are printed in green, failed executions in red.
         All log messages are stored as a plain list in self._result.log.
+        Console output can be disabled by building the class with verbose=False.
         """
-        RED = "\033[31;1m"
-        GREEN = "\033[32;1m"
-        WHITE = "\033[37;1m"
-        YELLOW = "\033[33;1m"
-        MAGENTA = "\033[35;1m"
-        RESET = "\033[0m"
+        write = sys.stdout.write if self._verbose else None
 
-        for key, value in jinja.output.items():
+        # The parent caches are kept across renders, they hold the MOs already attached to the shared Uni and ConfigRequest
+
+        out = jinja.output
+        success = False
+        for key, value in out.items():
             # Skip empty values
-            if value in (None, [], {}, ""):
+            if not value:
                 continue
 
-            caller = getattr(CobraClass, key, None)
+            handler = self._HANDLERS.get(key)
 
-            if not callable(caller):
+            if handler is None:
                 msg = f"[Cobra] -> [ConfigError]: Class {key} does not exist. "
-                print(f"{YELLOW}[Cobra] -> [ConfigError]::{RED} Class {key} does not exist.{RESET}")
-                self._result.log = msg
+                if write:
+                    write(_MISSING_FMT % key)
+                self._result.log_append(msg)
                 success = False
                 continue
             try:
-                caller(self, value)
+                # Placeholder classes are logged as before but not called, and add nothing
+                if handler is not _noop:
+                    handler(self, value)
                 msg = f"[Cobra]: Class {key} was rendered successfully."
-                print(f"{YELLOW}[Cobra]:{GREEN} Class {key} was rendered successfully.{RESET}")
-                self._result.log = msg
+                if write:
+                    write(_OK_FMT % key)
+                self._result.log_append(msg)
                 success = True
             except Exception as e:
                 msg = f"[Cobra] -> [{type(e).__name__}]: Class {key} failed: {e}"
-                print(f"{YELLOW}[Cobra] -> [{type(e).__name__}]:{RED} Class {key} failed, {e}{RESET}")
-                self._result.log = msg
+                if write:
+                    write(_ERR_FMT % (type(e).__name__, key, e))
+                self._result.log_append(msg)
                 success = False
 
         if not self.config.configMos:
-            msg = f"[Cobra] -> [ConfigError]: No object was found in configuration."
-            print(f"{YELLOW}[Cobra] -> [ConfigError]:{RED} No object was found in configuration.{RESET} ")  # red in console
-            self._result.log = msg
+            msg = "[Cobra] -> [ConfigError]: No object was found in configuration."
+            if write:
+                write(_EMPTY_MSG)  # red in console
+            self._result.log_append(msg)
             success = False
 
         self._result.config = self.config
+        self._result.input_json = out
         self._result.success = success
 
+    def _add_many(self, mos) -> None:
+        """
+        Add a batch of MOs to the configuration request
+        """
+        addMo = self.config.addMo
+        for mo in mos:
+            addMo(mo)
+
+    def _build_tree(self, parent, item, rule) -> None:
+        """
+        Add item under parent and then build its nested children, walking the rule with an explicit stack
+        """
+        root = parent
+        stack = [(parent, item, rule)]
+        while stack:
+            parent, item, (cls, valid, singles, lists) = stack.pop()
+            if not valid(item):
+                continue
+            mo = cls(parent, **(_props(item) if singles or lists else item))
+            if parent is root:
+                # The nested children attach to mo on creation and are sent with it
+                self.config.addMo(mo)
+            children = []
+            for key, child in singles:
+                sub = item.get(key)
+                if sub is not None:
+                    children.append((mo, sub, child))
+            for key, child in lists:
+                for sub in item.get(key) or ():
+                    children.append((mo, sub, child))
+            # Reversed so the stack pops the children in their original order
+            stack.extend(reversed(children))
+
+    def _tenant(self, name, **props):
+        """
+        Return the Tenant MO for the given name, building it once per CobraClass, props are set on the shared MO
+        """
+        Tenant = self.__tenant_cache.get(name)
+        if Tenant is None:
+            Tenant = FvTenant(self.__uni, name=name, **props)
+            self.__tenant_cache[name] = Tenant
+        else:
+            for prop, val in props.items():
+                setattr(Tenant, prop, val)
+        return Tenant
+
+    def _ap(self, tenant, name, **props):
+        """
+        Return the Application Profile MO for the given tenant and name, building it once per CobraClass, props are set on the shared MO
+        """
+        Ap = self.__ap_cache.get((tenant, name))
+        if Ap is None:
+            Ap = FvAp(self._tenant(tenant), name=name, **props)
+            self.__ap_cache[(tenant, name)] = Ap
+        else:
+            for prop, val in props.items():
+                setattr(Ap, prop, val)
+        return Ap
+
+    def _infra(self):
+        """
+        Return the infra MO, building it once per CobraClass
+        """
+        Infra = self.__parents.get("infraInfra")
+        if Infra is None:
+            Infra = self.__parents["infraInfra"] = InfraInfra(self.__uni)
+        return Infra
+
+    def _infra_funcp(self):
+        """
+        Return the infra FuncP MO, building it once per CobraClass
+        """
+        FuncP = self.__parents.get("infraFuncP")
+        if FuncP is None:
+            FuncP = self.__parents["infraFuncP"] = InfraFuncP(self._infra())
+        return FuncP
+
+    def _fabric_inst(self):
+        """
+        Return the fabric Inst MO, building it once per CobraClass
+        """
+        Inst = self.__parents.get("fabricInst")
+        if Inst is None:
+            Inst = self.__parents["fabricInst"] = FabricInst(self.__uni)
+        return Inst
+
+    def _fabric_funcp(self):
+        """
+        Return the fabric FuncP MO, building it once per CobraClass
+        """
+        FuncP = self.__parents.get("fabricFuncP")
+        if FuncP is None:
+            FuncP = self.__parents["fabricFuncP"] = FabricFuncP(self._fabric_inst())
+        return FuncP
+
+    def _ctrlr_inst(self):
+        """
+        Return the controller Inst MO, building it once per CobraClass
+        """
+        Inst = self.__parents.get("ctrlrInst")
+        if Inst is None:
+            Inst = self.__parents["ctrlrInst"] = CtrlrInst(self.__uni)
+        return Inst
+
     # -------------------------------------------------   REST Tenant Management
 
     def fvTenant(self, value) -> None:
         """
         Tenants > All Tenants
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvTenant in value:
-            Tenant = cobra.model.fv.Tenant(Uni, **fvTenant)
+            # Through the cache, so a later handler's _tenant() reuses this MO instead of replacing it under Uni
+            Tenant = self._tenant(**fvTenant)
             self.config.addMo(Tenant)
 
     def fvAp(self, value) -> None:
         """
         Tenants > Application Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvAp in value:
-            if not_nan_str(fvAp, ["name", "tenant"]):
-                Tenant = cobra.model.fv.Tenant(Uni, name=fvAp["tenant"])
-                Ap = cobra.model.fv.Ap(Tenant, **fvAp)
+            if not_nan_str(fvAp, ("name", "tenant")):
+                props = {k: v for k, v in fvAp.items() if k not in ("tenant", "name")}
+                Ap = self._ap(fvAp["tenant"], fvAp["name"], **props)
                 self.config.addMo(Ap)
 
     def fvAEPg(self, value) -> None:
         """
         Tenants > Application Profiles > Application EPGs
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvAEPg in value:
-            Tenant = cobra.model.fv.Tenant(Uni, name=fvAEPg["tenant"])
-            Ap = cobra.model.fv.Ap(Tenant, name=fvAEPg["fvApName"])
-            AEPg = cobra.model.fv.AEPg(Ap, **fvAEPg)
-            self.config.addMo(AEPg)
-            if "fvRsBd" in fvAEPg:
-                if not_nan_str(fvAEPg["fvRsBd"], ["tnFvBDName"]):
-                    RsBd = cobra.model.fv.RsBd(AEPg, **fvAEPg["fvRsBd"])
-                    self.config.addMo(RsBd)
-            if "fvRsDomAtt" in fvAEPg:
-                for fvRsDomAtt in fvAEPg["fvRsDomAtt"]:
-                    if not_nan_str(fvRsDomAtt, ["tDn"]):
-                        RsDomAtt = cobra.model.fv.RsDomAtt(AEPg, **fvRsDomAtt)
-                        self.config.addMo(RsDomAtt)
-            if "fvRsPathAtt" in fvAEPg:
-                for fvRsPathAtt in fvAEPg["fvRsPathAtt"]:
-                    if not_nan_str(fvRsPathAtt, ["tDn", "primaryEncap", "mode"]):
-                        RsPathAtt = cobra.model.fv.RsPathAtt(AEPg, **fvRsPathAtt)
-                        self.config.addMo(RsPathAtt)
+            Ap = self._ap(fvAEPg["tenant"], fvAEPg["fvApName"])
+            AEPg = FvAEPg(Ap, **_props(fvAEPg))
+            mos = [AEPg]
+            for key, cls, valid in _RULES_FVAEPG:
+                sub = fvAEPg.get(key)
+                if sub is not None and valid(sub):
+                    mos.append(cls(AEPg, **sub))
+            for key, cls, valid in _RULES_FVAEPG_CHILDREN:
+                for sub in fvAEPg.get(key) or ():
+                    if valid(sub):
+                        mos.append(cls(AEPg, **sub))
+            self._add_many(mos)
 
     def staticPath(self, value) -> None:
         """
         Tenants > Application Profiles > Application EPGs > EPG Name > Static Ports
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvAp in value:
-            Tenant = cobra.model.fv.Tenant(Uni, name=fvAp["tenant"])
+            Tenant = self._tenant(fvAp["tenant"])
             self.config.addMo(Tenant)
-            Ap = cobra.model.fv.Ap(Tenant, **fvAp)
+            props = {k: v for k, v in _props(fvAp).items() if k not in ("tenant", "name")}
+            Ap = self._ap(fvAp["tenant"], fvAp["name"], **props)
             self.config.addMo(Ap)
-            if "fvAEPg" in fvAp:
-                for fvAEPg in fvAp["fvAEPg"]:
-                    AEPg = cobra.model.fv.AEPg(Ap, **fvAEPg)
-                    # self.config.addMo(AEPg)
-                    if "fvRsPathAtt" in fvAEPg:
-                        for fvRsPathAtt in fvAEPg["fvRsPathAtt"]:
-                            RsPathAtt = cobra.model.fv.RsPathAtt(AEPg, **fvRsPathAtt)
-                            self.config.addMo(RsPathAtt)
+            for fvAEPg in fvAp.get("fvAEPg") or ():
+                AEPg = FvAEPg(Ap, **_props(fvAEPg))
+                # self.config.addMo(AEPg)
+                for fvRsPathAtt in fvAEPg.get("fvRsPathAtt") or ():
+                    RsPathAtt = FvRsPathAtt(AEPg, **fvRsPathAtt)
+                    self.config.addMo(RsPathAtt)
 
     def fvRsPathAtt(self, value) -> None:
         """
         Tenants > Application Profiles > Application EPGs > EPG Name > Static Ports
         """
-        Uni = cobra.model.pol.Uni(self.__root)
+        AEPgs = {}
         for fvRsPathAtt in value:
-            if not_nan_str(fvRsPathAtt, ["tenant", "fvApName", "fvAEPgName", "tDn", "primaryEncap", "mode"]):
-                Tenant = cobra.model.fv.Tenant(Uni, name=fvRsPathAtt["tenant"])
-                self.config.addMo(Tenant)
-                Ap = cobra.model.fv.Ap(Tenant, name=fvRsPathAtt["fvApName"])
-                self.config.addMo(Ap)
-                AEPg = cobra.model.fv.AEPg(Ap, name=fvRsPathAtt["fvAEPgName"])
-                self.config.addMo(AEPg)
-                RsPathAtt = cobra.model.fv.RsPathAtt(AEPg, **fvRsPathAtt)
+            if not_nan_str(fvRsPathAtt, ("tenant", "fvApName", "fvAEPgName", "tDn", "primaryEncap", "mode")):
+                key = (fvRsPathAtt["tenant"], fvRsPathAtt["fvApName"], fvRsPathAtt["fvAEPgName"])
+                AEPg = AEPgs.get(key)
+                if AEPg is None:
+                    Ap = self._ap(fvRsPathAtt["tenant"], fvRsPathAtt["fvApName"])
+                    AEPg = FvAEPg(Ap, name=fvRsPathAtt["fvAEPgName"])
+                    self.config.addMo(self._tenant(fvRsPathAtt["tenant"]))
+                    self.config.addMo(Ap)
+                    self.config.addMo(AEPg)
+                    AEPgs[key] = AEPg
+                RsPathAtt = FvRsPathAtt(AEPg, **fvRsPathAtt)
                 self.config.addMo(RsPathAtt)
 
     def tenant_application_uepg(self, value) -> None:
@@ -301,1553 +936,909 @@ class CobraClass:
             mo = item
             self.config.addMo(mo)
 
-    def tenant_application_esg(self, value):
-        """
-        Tenants > Application Profiles > Endpoint Security Groups
-        """
-        pass
-
     def fvBD(self, value) -> None:
         """
         Tenants > Networking > Bridge Domains
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvBD in value:
-            Tenant = cobra.model.fv.Tenant(Uni, name=fvBD["tenant"])
-            BD = cobra.model.fv.BD(Tenant, **fvBD)
-            self.config.addMo(BD)
-            if "fvRsCtx" in fvBD:
-                if not_nan_str(fvBD["fvRsCtx"], ["tnFvCtxName"]):
-                    RsCtx = cobra.model.fv.RsCtx(BD, **fvBD["fvRsCtx"])
-                    self.config.addMo(RsCtx)
-            if "igmpIfP" in fvBD:
-                if not_nan_str(fvBD["igmpIfP"], ["name"]):
-                    IfP = cobra.model.igmp.IfP(BD, **fvBD["igmpIfP"])
-                    self.config.addMo(IfP)
-            if "fvRsBdToEpRet" in fvBD:
-                if not_nan_str(fvBD["fvRsBdToEpRet"], ["tnFvEpRetPolName"]):
-                    RsBdToEpRet = cobra.model.fv.RsBdToEpRet(BD, **fvBD["fvRsBdToEpRet"])
-                    self.config.addMo(RsBdToEpRet)
-            if "fvRsIgmpsn" in fvBD:
-                if not_nan_str(fvBD["fvRsIgmpsn"], ["tnIgmpSnoopPolName"]):
-                    RsIgmpsn = cobra.model.fv.RsIgmpsn(BD, **fvBD["fvRsIgmpsn"])
-                    self.config.addMo(RsIgmpsn)
-            if "fvRsMldsn" in fvBD:
-                if not_nan_str(fvBD["fvRsMldsn"], ["tnMldSnoopPolName"]):
-                    RsMldsn = cobra.model.fv.RsMldsn(BD, **fvBD["fvRsMldsn"])
-                    self.config.addMo(RsMldsn)
-            if "fvRsBDToOut" in fvBD:
-                if not_nan_str(fvBD["fvRsBDToOut"], ["tnL3extOutName"]):
-                    RsBDToOut = cobra.model.fv.RsBDToOut(BD, **fvBD["fvRsBDToOut"])
-                    self.config.addMo(RsBDToOut)
-            if "fvSubnet" in fvBD:
-                for fvSubnet in fvBD["fvSubnet"]:
-                    if not_nan_str(fvSubnet, ["ip"]):
-                        Subnet = cobra.model.fv.Subnet(BD, **fvSubnet)
-                        self.config.addMo(Subnet)
+            Tenant = self._tenant(fvBD["tenant"])
+            BD = FvBD(Tenant, **_props(fvBD))
+            mos = [BD]
+            for key, cls, valid in _RULES_FVBD:
+                sub = fvBD.get(key)
+                if sub is not None and valid(sub):
+                    mos.append(cls(BD, **sub))
+            for key, cls, valid in _RULES_FVBD_CHILDREN:
+                for sub in fvBD.get(key) or ():
+                    if valid(sub):
+                        mos.append(cls(BD, **sub))
+            self._add_many(mos)
 
     def fvCtx(self, value) -> None:
         """
         Tenants > Networking > VRFs
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvCtx in value:
-            Tenant = cobra.model.fv.Tenant(Uni, name=fvCtx["tenant"])
-            Ctx = cobra.model.fv.Ctx(Tenant, **fvCtx)
-            self.config.addMo(Ctx)
-            if "vzAny" in fvCtx:
-                Any = cobra.model.vz.Any(Ctx, **fvCtx["vzAny"])
-                self.config.addMo(Any)
-                if "vzRsAnyToProv" in fvCtx["vzAny"]:
-                    for vzRsAnyToProv in fvCtx["vzAny"]["vzRsAnyToProv"]:
-                        if not_nan_str(vzRsAnyToProv, ["tnVzBrCPName"]):
-                            RsAnyToProv = cobra.model.vz.RsAnyToProv(Any, **vzRsAnyToProv)
-                            self.config.addMo(RsAnyToProv)
-                if "vzRsAnyToCons" in fvCtx["vzAny"]:
-                    for vzRsAnyToCons in fvCtx["vzAny"]["vzRsAnyToCons"]:
-                        if not_nan_str(vzRsAnyToCons, ["tnVzBrCPName"]):
-                            RsAnyToCons = cobra.model.vz.RsAnyToCons(Any, **vzRsAnyToCons)
-                            self.config.addMo(RsAnyToCons)
-            if "fvRsCtxToEpRet" in fvCtx:
-                if not_nan_str(fvCtx["fvRsCtxToEpRet"], ["tnFvEpRetPolName"]):
-                    RsCtxToEpRet = cobra.model.fv.RsCtxToEpRet(Ctx, **fvCtx["fvRsCtxToEpRet"])
-                    self.config.addMo(RsCtxToEpRet)
-            if "fvRsCtxToExtRouteTagPol" in fvCtx:
-                if not_nan_str(fvCtx["fvRsCtxToExtRouteTagPol"], ["tnL3extRouteTagPolName"]):
-                    RsCtxToExtRouteTagPol = cobra.model.fv.RsCtxToExtRouteTagPol(Ctx, **fvCtx["fvRsCtxToExtRouteTagPol"])
-                    self.config.addMo(RsCtxToExtRouteTagPol)
-            if "fvRsOspfCtxPol" in fvCtx:
-                if not_nan_str(fvCtx["fvRsOspfCtxPol"], ["tnOspfCtxPolName"]):
-                    RsOspfCtxPol = cobra.model.fv.RsOspfCtxPol(Ctx, **fvCtx["fvRsOspfCtxPol"])
-                    self.config.addMo(RsOspfCtxPol)
-            if "fvRsBgpCtxPol" in fvCtx:
-                if not_nan_str(fvCtx["fvRsBgpCtxPol"], ["tnBgpCtxPolName"]):
-                    RsBgpCtxPol = cobra.model.fv.RsBgpCtxPol(Ctx, **fvCtx["fvRsBgpCtxPol"])
-                    self.config.addMo(RsBgpCtxPol)
-            if "fvRsVrfValidationPol" in fvCtx:
-                if not_nan_str(fvCtx["fvRsVrfValidationPol"], ["tnL3extVrfValidationPolName"]):
-                    RsVrfValidationPol = cobra.model.fv.RsVrfValidationPol(Ctx, **fvCtx["fvRsVrfValidationPol"])
-                    self.config.addMo(RsVrfValidationPol)
-            if "pimCtxP" in fvCtx:
-                if not_nan_str(fvCtx["pimCtxP"], ["mtu"]):
-                    CtxP = cobra.model.pim.CtxP(Ctx, **fvCtx["pimCtxP"])
-                    self.config.addMo(CtxP)
-
-    def tenant_network_l2out(self, value):
-        """
-        Tenants > Networking > L2Outs
-        """
-        pass
+            Tenant = self._tenant(fvCtx["tenant"])
+            Ctx = FvCtx(Tenant, **_props(fvCtx))
+            mos = [Ctx]
+            if (vzAny := fvCtx.get("vzAny")) is not None:
+                Any = VzAny(Ctx, **_props(vzAny))
+                mos.append(Any)
+                for key, cls, valid in _RULES_VZANY_CHILDREN:
+                    for sub in vzAny.get(key) or ():
+                        if valid(sub):
+                            mos.append(cls(Any, **sub))
+            for key, cls, valid in _RULES_FVCTX:
+                sub = fvCtx.get(key)
+                if sub is not None and valid(sub):
+                    mos.append(cls(Ctx, **sub))
+            self._add_many(mos)
 
     def l3extOut(self, value) -> None:
         """
         Tenants > Networking > L3Outs
         """
         for item in value:
-            mo = cobra.model.l3ext.Out(self.tenant(**item), **item)
-            if "l3extRsEctx" in item:
-                cobra.model.l3ext.RsEctx(mo, **item["l3extRsEctx"])
-            if "l3extRsL3DomAtt" in item:
-                cobra.model.l3ext.RsL3DomAtt(mo, **item["l3extRsL3DomAtt"])
-            if "ospfExtP" in item:
-                cobra.model.ospf.ExtP(mo, **item["ospfExtP"])
-            if "l3extLNodeP" in item:
-                for node in item["l3extLNodeP"]:
-                    l3ext_lnodep = cobra.model.l3ext.LNodeP(mo, **node)
-                    if "l3extRsNodeL3OutAtt" in node:
-                        for node_l3out_att in node["l3extRsNodeL3OutAtt"]:
-                            cobra.model.l3ext.RsNodeL3OutAtt(l3ext_lnodep, **node_l3out_att)
-                    if "l3extLIfP" in node:
-                        l3ext_lifp = cobra.model.l3ext.LIfP(l3ext_lnodep, **node["l3extLIfP"])
-                        if "l3extRsPathL3OutAtt" in node["l3extLIfP"]:
-                            for l3att in node["l3extLIfP"]["l3extRsPathL3OutAtt"]:
-                                cobra.model.l3ext.RsPathL3OutAtt(l3ext_lifp, **l3att)
+            mo = L3extOut(self._tenant(item["tenant"]), **_props(item))
+            if (sub := item.get("l3extRsEctx")) is not None:
+                L3extRsEctx(mo, **sub)
+            if (sub := item.get("l3extRsL3DomAtt")) is not None:
+                L3extRsL3DomAtt(mo, **sub)
+            if (sub := item.get("ospfExtP")) is not None:
+                OspfExtP(mo, **sub)
+            for node in item.get("l3extLNodeP") or ():
+                l3ext_lnodep = L3extLNodeP(mo, **_props(node))
+                for node_l3out_att in node.get("l3extRsNodeL3OutAtt") or ():
+                    L3extRsNodeL3OutAtt(l3ext_lnodep, **node_l3out_att)
+                if (lifp := node.get("l3extLIfP")) is not None:
+                    l3ext_lifp = L3extLIfP(l3ext_lnodep, **_props(lifp))
+                    for l3att in lifp.get("l3extRsPathL3OutAtt") or ():
+                        L3extRsPathL3OutAtt(l3ext_lifp, **l3att)
             self.config.addMo(mo)
 
-    def tenant_network_srmpls_l3out(self, value):
-        """
-        Tenants > Networking > SR-MPLS VRF L3Outs
-        """
-        pass
-
-    def tenant_dot1q_tunnel(self, value):
-        """
-        Tenants > Networking > Dot1Q Tunnels
-        """
-        pass
-
     def fvnsAddrInst(self, value):
         """
         Tenants > mgmt > IP Address Pools
         """
-        Uni = cobra.model.pol.Uni(self.__root)
         for fvnsAddrInst in value:
-            Tenant = cobra.model.fv.Tenant(Uni, name=fvnsAddrInst["tenant"])
-            AddrInst = cobra.model.fvns.AddrInst(Tenant, **fvnsAddrInst)
+            Tenant = self._tenant(fvnsAddrInst["tenant"])
+            AddrInst = FvnsAddrInst(Tenant, **_props(fvnsAddrInst))
             self.config.addMo(AddrInst)
-            if "fvnsUcastAddrBlk" in fvnsAddrInst:
-                for fvnsUcastAddrBlk in fvnsAddrInst["fvnsUcastAddrBlk"]:
-                    if not_nan_str(fvnsUcastAddrBlk, ["from"]):
-                        UcastAddrBlk = cobra.model.fvns.UcastAddrBlk(AddrInst, **fvnsUcastAddrBlk)
-                        self.config.addMo(UcastAddrBlk)
+            for fvnsUcastAddrBlk in _valid_children(fvnsAddrInst, "fvnsUcastAddrBlk", ("from",)):
+                UcastAddrBlk = FvnsUcastAddrBlk(AddrInst, **fvnsUcastAddrBlk)
+                self.config.addMo(UcastAddrBlk)
 
     def mgmtGrp(self, value):
         """
         Tenants > mgmt > Managed Node Connectivity Groups
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        FuncP = cobra.model.infra.FuncP(Infra)
+        FuncP = self._infra_funcp()
         for mgmtGrp in value:
-            Grp = cobra.model.mgmt.Grp(FuncP, **mgmtGrp)
+            Grp = MgmtGrp(FuncP, **_props(mgmtGrp))
             self.config.addMo(Grp)
-            if "mgmtOoBZone" in mgmtGrp:
-                OoBZone = cobra.model.mgmt.OoBZone(Grp)
-                if "mgmtRsOoB" in mgmtGrp["mgmtOoBZone"]:
-                    RsOoB = cobra.model.mgmt.RsOoB(OoBZone, **mgmtGrp["mgmtOoBZone"]["mgmtRsOoB"])
+            if (mgmtOoBZone := mgmtGrp.get("mgmtOoBZone")) is not None:
+                OoBZone = MgmtOoBZone(Grp)
+                if (sub := mgmtOoBZone.get("mgmtRsOoB")) is not None:
+                    RsOoB = MgmtRsOoB(OoBZone, **sub)
                     self.config.addMo(RsOoB)
-                if "mgmtRsAddrInst" in mgmtGrp["mgmtOoBZone"]:
-                    RsAddrInst = cobra.model.mgmt.RsAddrInst(OoBZone, **mgmtGrp["mgmtOoBZone"]["mgmtRsAddrInst"])
+                if (sub := mgmtOoBZone.get("mgmtRsAddrInst")) is not None:
+                    RsAddrInst = MgmtRsAddrInst(OoBZone, **sub)
                     self.config.addMo(RsAddrInst)
-            if "mgmtInBZone" in mgmtGrp:
-                InBZone = cobra.model.mgmt.InBZone(Grp)
-                if "mgmtRsInB" in mgmtGrp["mgmtInBZone"]:
-                    RsInB = cobra.model.mgmt.RsInB(InBZone, **mgmtGrp["mgmtInBZone"]["mgmtRsInB"])
+            if (mgmtInBZone := mgmtGrp.get("mgmtInBZone")) is not None:
+                InBZone = MgmtInBZone(Grp)
+                if (sub := mgmtInBZone.get("mgmtRsInB")) is not None:
+                    RsInB = MgmtRsInB(InBZone, **sub)
                     self.config.addMo(RsInB)
-                if "mgmtRsAddrInst" in mgmtGrp["mgmtInBZone"]:
-                    RsAddrInst = cobra.model.mgmt.RsAddrInst(InBZone, **mgmtGrp["mgmtInBZone"]["mgmtRsAddrInst"])
+                if (sub := mgmtInBZone.get("mgmtRsAddrInst")) is not None:
+                    RsAddrInst = MgmtRsAddrInst(InBZone, **sub)
                     self.config.addMo(RsAddrInst)
 
     def mgmtNodeGrp(self, value):
         """
         Tenants > mgmt > Node Management Addresses
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        Infra = self._infra()
         for mgmtNodeGrp in value:
-            NodeGrp = cobra.model.mgmt.NodeGrp(Infra, **mgmtNodeGrp)
+            NodeGrp = MgmtNodeGrp(Infra, **_props(mgmtNodeGrp))
             self.config.addMo(NodeGrp)
-            if "mgmtRsGrp" in mgmtNodeGrp:
-                for mgmtRsGrp in mgmtNodeGrp["mgmtRsGrp"]:
-                    RsGrp = cobra.model.mgmt.RsGrp(NodeGrp, **mgmtRsGrp)
-                    self.config.addMo(RsGrp)
-            if "infraNodeBlk" in mgmtNodeGrp:
-                for infraNodeBlk in mgmtNodeGrp["infraNodeBlk"]:
-                    if not_nan_str(infraNodeBlk, ["from_"]):
-                        NodeBlk = cobra.model.infra.NodeBlk(NodeGrp, **infraNodeBlk)
-                        self.config.addMo(NodeBlk)
-
-    def tenant_contract_standard(self, value):
-        """
-        Tenants > Contracts > Standard
-        """
-        pass
-
-    def tenant_contract_taboo(self, value):
-        """
-        Tenants > Contracts > Taboos
-        """
-        pass
-
-    def tenant_contract_imported(self, value):
-        """
-        Tenants > Contracts > Imported
-        """
-        pass
-
-    def tenant_contract_filter(self, value):
-        """
-        Tenants > Contracts > Filters
-        """
-        pass
-
-    def tenant_contract_oob(self, value):
-        """
-        Tenants > Contracts > Out-Of-Band Contracts
-        """
-        pass
-
-    def tenant_policy_protocol_bfd(self, value):
-        """
-        Tenants > Policies > Protocol > BFD
-        """
-        pass
-
-    def tenant_policy_protocol_bgp(self, value):
-        """
-        Tenants > Policies > Protocol > BGP
-        """
-        pass
-
-    def tenant_policy_protocol_qos(self, value):
-        """
-        Tenants > Policies > Protocol > Custom QoS
-        """
-        pass
-
-    def tenant_policy_protocol_dhcp(self, value):
-        """
-        Tenants > Policies > Protocol > DHCP
-        """
-        pass
-
-    def tenant_policy_protocol_dataplane(self, value):
-        """
-        Tenants > Policies > Protocol > Data Plane Policing
-        """
-        pass
-
-    def tenant_policy_protocol_eigrp(self, value):
-        """
-        Tenants > Policies > Protocol > EIGRP
-        """
-        pass
-
-    def tenant_policy_protocol_endpoint_retention(self, value):
-        """
-        Tenants > Policies > Protocol > End Point Retention
-        """
-        pass
-
-    def tenant_policy_protocol_firsthop_security(self, value):
-        """
-        Tenants > Policies > Protocol > First Hop Security
-        """
-        pass
-
-    def tenant_policy_protocol_hsrp(self, value):
-        """
-        Tenants > Policies > Protocol > HSRP
-        """
-        pass
-
-    def tenant_policy_protocol_igmp(self, value):
-        """
-        Tenants > Policies > Protocol > IGMP
-        """
-        pass
-
-    def tenant_policy_protocol_ip_sla(self, value):
-        """
-        Tenants > Policies > Protocol > IP SLA
-        """
-        pass
-
-    def tenant_policy_protocol_pbr(self, value):
-        """
-        Tenants > Policies > Protocol > L4-L7 Policy-Based Redirect
-        """
-        pass
-
-    def tenant_policy_protocol_ospf(self, value):
-        """
-        Tenants > Policies > Protocol > OSPF
-        """
-        pass
-
-    def tenant_policy_protocol_pim(self, value):
-        """
-        Tenants > Policies > Protocol > PIM
-        """
-        pass
-
-    def tenant_policy_protocol_routemap_multicast(self, value):
-        """
-        Tenants > Policies > Protocol > Route Maps for Multicast
-        """
-        pass
-
-    def tenant_policy_protocol_routemap_control(self, value):
-        """
-        Tenants > Policies > Protocol > Route Maps for Route Control
-        """
-        pass
-
-    def tenant_policy_protocol_route_tag(self, value):
-        """
-        Tenants > Policies > Protocol > Route Tag
-        """
-        pass
-
-    def tenant_policy_troubleshooting_span(self, value):
-        """
-        Tenants > Policies > Troubleshooting SPAN
-        """
-        pass
-
-    def tenant_policy_troubleshooting_traceroute(self, value):
-        """
-        Tenants > Policies > Troubleshooting Traceroute
-        """
-        pass
-
-    def tenant_policy_monitoring(self, value):
-        """
-        Tenants > Policies > Monitoring
-        """
-        pass
-
-    def tenant_policy_netflow(self, value):
-        """
-        Tenants > Policies > NetFlow
-        """
-        pass
-
-    def tenant_policy_vmm(self, value):
-        """
-        Tenants > Policies > VMM
-        """
-        pass
-
-    def tenant_service_parameter(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Service Parameters
-        """
-        pass
-
-    def tenant_service_graph_template(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Service Graph Templates
-        """
-        pass
-
-    def tenant_service_router_configuration(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Router Configuration
-        """
-        pass
-
-    def tenant_service_function_profile(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Function Profiles
-        """
-        pass
-
-    def tenant_service_devices(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Devices
-        """
-        pass
-
-    def tenant_service_imported_device(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Imported Devices
-        """
-        pass
-
-    def tenant_service_device_policy(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Device Selection Policies
-        """
-        pass
-
-    def tenant_service_deployed_graph_instance(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Deployed Graph Instances
-        """
-        pass
-
-    def tenant_service_deployed_device(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Deployed Devices
-        """
-        pass
-
-    def tenant_service_device_manager(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Device Managers
-        """
-        pass
-
-    def tenant_service_chassis(self, value):
-        """
-        Tenants > Policies > Services > L4-L7 > Chassis
-        """
-        pass
-
-    def tenant_node_management_epg(self, value):
-        """
-        Tenants > Node Management EPGs
-        """
-        pass
-
-    def tenant_external_management_profile(self, value):
-        """
-        Tenants > External Management Network Instance Profiles
-        """
-        pass
-
-    def tenant_node_management_address(self, value):
-        """
-        Tenants > Node Management Address
-        """
-        pass
-
-    def tenant_node_management_static(self, value):
-        """
-        Tenants > Node Management Address > Static Node Management Address
-        """
-        pass
-
-    def tenant_node_connection_group(self, value):
-        """
-        Tenants > Managed Node Connectivity Groups
-        """
-        pass
+            for mgmtRsGrp in mgmtNodeGrp.get("mgmtRsGrp") or ():
+                RsGrp = MgmtRsGrp(NodeGrp, **mgmtRsGrp)
+                self.config.addMo(RsGrp)
+            for infraNodeBlk in _valid_children(mgmtNodeGrp, "infraNodeBlk", ("from_",)):
+                NodeBlk = InfraNodeBlk(NodeGrp, **infraNodeBlk)
+                self.config.addMo(NodeBlk)
 
     def fabricSetupPol(self, value):
         """
         Fabric > Inventory > Pod Fabric Setup Policy
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.ctrlr.Inst(Uni)
+        Inst = self._ctrlr_inst()
         for fabricSetupPol in value:
-            SetupPol = cobra.model.fabric.SetupPol(Inst, **fabricSetupPol)
+            SetupPol = FabricSetupPol(Inst, **_props(fabricSetupPol))
             self.config.addMo(SetupPol)
-            if "fabricSetupP" in fabricSetupPol:
-                for fabricSetupP in fabricSetupPol["fabricSetupP"]:
-                    SetupP = cobra.model.fabric.SetupP(SetupPol, **fabricSetupP)
-                    self.config.addMo(SetupP)
+            for fabricSetupP in fabricSetupPol.get("fabricSetupP") or ():
+                SetupP = FabricSetupP(SetupPol, **fabricSetupP)
+                self.config.addMo(SetupP)
 
     def fabricRsOosPath(self, value):
         """
         Fabric > RsOosPath
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.fabric.Inst(Uni)
-        OOServicePol = cobra.model.fabric.OOServicePol(Inst)
+        Inst = self._fabric_inst()
+        OOServicePol = FabricOOServicePol(Inst)
         for fabricRsOosPath in value:
-            RsOosPath = cobra.model.fabric.RsOosPath(OOServicePol, **fabricRsOosPath)
+            RsOosPath = FabricRsOosPath(OOServicePol, **fabricRsOosPath)
             self.config.addMo(RsOosPath)
 
     def fabricSetupP(self, value):
         """
         Fabric > Inventory > Pod Fabric Setup Policy
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.ctrlr.Inst(Uni)
-        SetupPol = cobra.model.fabric.SetupPol(Inst)
+        Inst = self._ctrlr_inst()
+        SetupPol = FabricSetupPol(Inst)
         self.config.addMo(SetupPol)
         for fabricSetupP in value:
-            SetupP = cobra.model.fabric.SetupP(SetupPol, **fabricSetupP)
+            SetupP = FabricSetupP(SetupPol, **fabricSetupP)
             self.config.addMo(SetupP)
 
     def fabricNodeIdentPol(self, value):
         """
         Fabric > Inventory > Fabric Membership
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.ctrlr.Inst(Uni)
+        Inst = self._ctrlr_inst()
         for fabricNodeIdentPol in value:
-            NodeIdentPol = cobra.model.fabric.NodeIdentPol(Inst, **fabricNodeIdentPol)
+            NodeIdentPol = FabricNodeIdentPol(Inst, **_props(fabricNodeIdentPol))
             self.config.addMo(NodeIdentPol)
-            if "fabricNodeIdentP" in fabricNodeIdentPol:
-                for fabricNodeIdentPol in fabricNodeIdentPol["fabricNodeIdentP"]:
-                    NodeIdentP = cobra.model.fabric.NodeIdentP(NodeIdentPol, **fabricNodeIdentPol)
-                    self.config.addMo(NodeIdentP)
+            for fabricNodeIdentP in fabricNodeIdentPol.get("fabricNodeIdentP") or ():
+                NodeIdentP = FabricNodeIdentP(NodeIdentPol, **fabricNodeIdentP)
+                self.config.addMo(NodeIdentP)
 
     def fabricPodPGrp(self, value):
         """
         Fabric > Fabric Policies > Pods > Policy Groups
         """
+        fabric_func_p = self._fabric_funcp()
         for item in value:
-            fabric_inst = cobra.model.fabric.Inst(self.__uni)
-            fabric_func_p = cobra.model.fabric.FuncP(fabric_inst)
-            mo = cobra.model.fabric.PodPGrp(fabric_func_p, **item)
-            if "fabricRtPodPGrp" in item:
-                cobra.model.fabric.RtPodPGrp(mo, **item["fabricRtPodPGrp"])
-            if "fabricRsSnmpPol" in item:
-                cobra.model.fabric.RsSnmpPol(mo, **item["fabricRsSnmpPol"])
-            if "fabricRsPodPGrpIsisDomP" in item:
-                cobra.model.fabric.RsPodPGrpIsisDomP(mo, **item["fabricRsPodPGrpIsisDomP"])
-            if "fabricRsPodPGrpCoopP" in item:
-                cobra.model.fabric.RsPodPGrpCoopP(mo, **item["fabricRsPodPGrpCoopP"])
-            if "fabricRsPodPGrpBGPRRP" in item:
-                cobra.model.fabric.RsPodPGrpBGPRRP(mo, **item["fabricRsPodPGrpBGPRRP"])
-            if "fabricRsTimePol" in item:
-                cobra.model.fabric.RsTimePol(mo, **item["fabricRsTimePol"])
-            if "fabricRsMacsecPol" in item:
-                cobra.model.fabric.RsMacsecPol(mo, **item["fabricRsMacsecPol"])
-            if "fabricRsCommPol" in item:
-                cobra.model.fabric.RsCommPol(mo, **item["fabricRsCommPol"])
+            mo = FabricPodPGrp(fabric_func_p, **_props(item))
+            if (sub := item.get("fabricRtPodPGrp")) is not None:
+                FabricRtPodPGrp(mo, **sub)
+            if (sub := item.get("fabricRsSnmpPol")) is not None:
+                FabricRsSnmpPol(mo, **sub)
+            if (sub := item.get("fabricRsPodPGrpIsisDomP")) is not None:
+                FabricRsPodPGrpIsisDomP(mo, **sub)
+            if (sub := item.get("fabricRsPodPGrpCoopP")) is not None:
+                FabricRsPodPGrpCoopP(mo, **sub)
+            if (sub := item.get("fabricRsPodPGrpBGPRRP")) is not None:
+                FabricRsPodPGrpBGPRRP(mo, **sub)
+            if (sub := item.get("fabricRsTimePol")) is not None:
+                FabricRsTimePol(mo, **sub)
+            if (sub := item.get("fabricRsMacsecPol")) is not None:
+                FabricRsMacsecPol(mo, **sub)
+            if (sub := item.get("fabricRsCommPol")) is not None:
+                FabricRsCommPol(mo, **sub)
             self.config.addMo(mo)
 
     def fabricPodP(self, value):
         """
         Fabric > Fabric Policies > Pods > Profiles
         """
+        fabric_inst = self._fabric_inst()
         for item in value:
-            fabric_inst = cobra.model.fabric.Inst(self.__uni)
-            mo = cobra.model.fabric.PodP(fabric_inst, **item)
-            if "fabricPodS" in item:
-                for pod_s in item["fabricPodS"]:
-                    mo_pod_s = cobra.model.fabric.PodS(mo, **pod_s)
-                    if "fabricRsPodPGrp" in pod_s:
-                        cobra.model.fabric.RsPodPGrp(mo_pod_s, **pod_s["fabricRsPodPGrp"])
-                    if "fabricPodBlk" in pod_s:
-                        cobra.model.fabric.PodBlk(mo_pod_s, **pod_s["fabricPodBlk"])
+            mo = FabricPodP(fabric_inst, **_props(item))
+            for pod_s in item.get("fabricPodS") or ():
+                mo_pod_s = FabricPodS(mo, **_props(pod_s))
+                if (sub := pod_s.get("fabricRsPodPGrp")) is not None:
+                    FabricRsPodPGrp(mo_pod_s, **sub)
+                if (sub := pod_s.get("fabricPodBlk")) is not None:
+                    FabricPodBlk(mo_pod_s, **sub)
             self.config.addMo(mo)
 
-    def fabric_switch_leaf_profile(self, value):
-        """
-        Fabric > Fabric Policies > Switches > Leaf Switches > Profiles
-        """
-        pass
-
-    def fabric_switch_leaf_policy_group(self, value):
-        """
-        Fabric > Fabric Policies > Switches > Leaf Switches > Policy Groups
-        """
-        pass
-
-    def fabric_switch_spine_profile(self, value):
-        """
-        Fabric > Fabric Policies > Switches > Spine Switches > Profiles
-        """
-        pass
-
-    def fabric_switch_spine_policy_group(self, value):
-        """
-        Fabric > Fabric Policies > Switches > Spine Switches > Policy Groups
-        """
-        pass
-
-    def fabric_module_leaf_profile(self, value):
-        """
-        Fabric > Fabric Policies > Modules > Leaf Modules > Profiles
-        """
-        pass
-
-    def fabric_module_leaf_policy_group(self, value):
-        """
-        Fabric > Fabric Policies > Modules > Leaf Modules > Policy Groups
-        """
-        pass
-
-    def fabric_module_spine_profile(self, value):
-        """
-        Fabric > Fabric Policies > Modules > Spine Modules > Profiles
-        """
-        pass
-
-    def fabric_module_spine_policy_group(self, value):
-        """
-        Fabric > Fabric Policies > Modules > Spine Modules > Policy Groups
-        """
-        pass
-
-    def fabric_interface_leaf_profile(self, value):
-        """
-        Fabric > Fabric Policies > Interfaces > Leaf Interfaces > Profiles
-        """
-        pass
-
-    def fabric_interface_leaf_policy_group(self, value):
-        """
-        Fabric > Fabric Policies > Interfaces > Leaf Interfaces > Policy Groups
-        """
-        pass
-
-    def fabric_interface_spine_profile(self, value):
-        """
-        Fabric > Fabric Policies > Interfaces > Spine Interfaces > Profiles
-        """
-        pass
-
-    def fabric_interface_spine_policy_group(self, value):
-        """
-        Fabric > Fabric Policies > Interfaces > Spine Interfaces > Policy Groups
-        """
-        pass
-
     def datetimePol(self, value):
         """
         Fabric > Fabric Policies > Policies > Pod > Date and Time
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Inst = self._fabric_inst()
         for datetimePol in value:
-            Pol = cobra.model.datetime.Pol(Inst, **datetimePol)
-            self.config.addMo(Pol)
-            if "datetimeNtpAuthKey" in datetimePol:
-                for datetimeNtpAuthKey in datetimePol["datetimeNtpAuthKey"]:
-                    if not_nan_str(datetimeNtpAuthKey, ["id", "key", "trusted", "keyType"]):
-                        NtpAuthKey = cobra.model.datetime.NtpAuthKey(Pol, **datetimeNtpAuthKey)
-                        self.config.addMo(NtpAuthKey)
-            if "datetimeNtpProv" in datetimePol:
-                for datetimeNtpProv in datetimePol["datetimeNtpProv"]:
-                    if not_nan_str(datetimeNtpProv, ["name"]):
-                        NtpProv = cobra.model.datetime.NtpProv(Pol, **datetimeNtpProv)
-                        self.config.addMo(NtpProv)
-                        if "datetimeRsNtpProvToNtpAuthKey" in datetimeNtpProv:
-                            for datetimeRsNtpProvToNtpAuthKey in datetimeNtpProv["datetimeRsNtpProvToNtpAuthKey"]:
-                                if not_nan_str(datetimeRsNtpProvToNtpAuthKey, ["tnDatetimeNtpAuthKeyId"]):
-                                    RsNtpProvToNtpAuthKey = cobra.model.datetime.RsNtpProvToNtpAuthKey(NtpProv, **datetimeRsNtpProvToNtpAuthKey)
-                                    self.config.addMo(RsNtpProvToNtpAuthKey)
-                        if "datetimeRsNtpProvToEpg" in datetimeNtpProv:
-                            if not_nan_str(datetimeNtpProv["datetimeRsNtpProvToEpg"], ["tDn"]):
-                                RsNtpProvToEpg = cobra.model.datetime.RsNtpProvToEpg(NtpProv, **datetimeNtpProv["datetimeRsNtpProvToEpg"])
-                                self.config.addMo(RsNtpProvToEpg)
+            Pol = DatetimePol(Inst, **_props(datetimePol))
+            addMo(Pol)
+            for datetimeNtpAuthKey in _valid_children(datetimePol, "datetimeNtpAuthKey", ("id", "key", "trusted", "keyType")):
+                NtpAuthKey = DatetimeNtpAuthKey(Pol, **datetimeNtpAuthKey)
+                addMo(NtpAuthKey)
+            for datetimeNtpProv in _valid_children(datetimePol, "datetimeNtpProv", ("name",)):
+                NtpProv = DatetimeNtpProv(Pol, **_props(datetimeNtpProv))
+                addMo(NtpProv)
+                for datetimeRsNtpProvToNtpAuthKey in _valid_children(datetimeNtpProv, "datetimeRsNtpProvToNtpAuthKey", ("tnDatetimeNtpAuthKeyId",)):
+                    RsNtpProvToNtpAuthKey = DatetimeRsNtpProvToNtpAuthKey(NtpProv, **datetimeRsNtpProvToNtpAuthKey)
+                    addMo(RsNtpProvToNtpAuthKey)
+                if (sub := datetimeNtpProv.get("datetimeRsNtpProvToEpg")) is not None and not_nan_value(sub, "tDn"):
+                    RsNtpProvToEpg = DatetimeRsNtpProvToEpg(NtpProv, **sub)
+                    addMo(RsNtpProvToEpg)
 
     def snmpPol(self, value):
         """
         Fabric > Fabric Policies > Policies > Pod > SNMP
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Inst = self._fabric_inst()
         for snmpPol in value:
-            if not_nan_str(snmpPol, ["name"]):
-                Pol = cobra.model.snmp.Pol(Inst, **snmpPol)
-                self.config.addMo(Pol)
-                if "snmpClientGrpP" in snmpPol:
-                    for snmpClientGrpP in snmpPol["snmpClientGrpP"]:
-                        if not_nan_str(snmpClientGrpP, ["name"]):
-                            ClientGrpP = cobra.model.snmp.ClientGrpP(Pol, **snmpClientGrpP)
-                            if "snmpRsEpg" in snmpClientGrpP:
-                                if not_nan_str(snmpClientGrpP["snmpRsEpg"], ["tDn"]):
-                                    RsEpg = cobra.model.snmp.RsEpg(ClientGrpP, **snmpClientGrpP["snmpRsEpg"])
-                                    self.config.addMo(RsEpg)
-                            if "snmpClientP" in snmpClientGrpP:
-                                for snmpClientP in snmpClientGrpP["snmpClientP"]:
-                                    if not_nan_str(snmpClientP, ["name", "addr"]):
-                                        ClientP = cobra.model.snmp.ClientP(ClientGrpP, **snmpClientP)
-                                        self.config.addMo(ClientP)
-                if "snmpUserP" in snmpPol:
-                    for snmpUserP in snmpPol["snmpUserP"]:
-                        if not_nan_str(snmpUserP, ["name", "privType", "privKey", "authType", "authKey"]):
-                            UserP = cobra.model.snmp.UserP(Pol, **snmpUserP)
-                            self.config.addMo(UserP)
-                if "snmpCommunityP" in snmpPol:
-                    for snmpCommunityP in snmpPol["snmpCommunityP"]:
-                        if not_nan_str(snmpCommunityP, ["name"]):
-                            CommunityP = cobra.model.snmp.CommunityP(Pol, **snmpCommunityP)
-                            self.config.addMo(CommunityP)
-                if "snmpTrapFwdServerP" in snmpPol:
-                    for snmpTrapFwdServerP in snmpPol["snmpTrapFwdServerP"]:
-                        if not_nan_str(snmpTrapFwdServerP, ["addr", "port"]):
-                            TrapFwdServerP = cobra.model.snmp.TrapFwdServerP(Pol, **snmpTrapFwdServerP)
-                            self.config.addMo(TrapFwdServerP)
+            if not_nan_value(snmpPol, "name"):
+                Pol = SnmpPol(Inst, **_props(snmpPol))
+                addMo(Pol)
+                for snmpClientGrpP in _valid_children(snmpPol, "snmpClientGrpP", ("name",)):
+                    ClientGrpP = SnmpClientGrpP(Pol, **_props(snmpClientGrpP))
+                    if (sub := snmpClientGrpP.get("snmpRsEpg")) is not None and not_nan_value(sub, "tDn"):
+                        RsEpg = SnmpRsEpg(ClientGrpP, **sub)
+                        addMo(RsEpg)
+                    for snmpClientP in _valid_children(snmpClientGrpP, "snmpClientP", ("name", "addr")):
+                        ClientP = SnmpClientP(ClientGrpP, **snmpClientP)
+                        addMo(ClientP)
+                for snmpUserP in _valid_children(snmpPol, "snmpUserP", ("name", "privType", "privKey", "authType", "authKey")):
+                    UserP = SnmpUserP(Pol, **snmpUserP)
+                    addMo(UserP)
+                for snmpCommunityP in _valid_children(snmpPol, "snmpCommunityP", ("name",)):
+                    CommunityP = SnmpCommunityP(Pol, **snmpCommunityP)
+                    addMo(CommunityP)
+                for snmpTrapFwdServerP in _valid_children(snmpPol, "snmpTrapFwdServerP", ("addr", "port")):
+                    TrapFwdServerP = SnmpTrapFwdServerP(Pol, **snmpTrapFwdServerP)
+                    addMo(TrapFwdServerP)
 
     def commPol(self, value):
         """
         Fabric > Fabric Policies > Policies > Pod > Management Access
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
+        rules = _RULES_COMMPOL
         for commPol in value:
-            Pol = cobra.model.comm.Pol(Inst, **commPol)
-            self.config.addMo(Pol)
-            if "commTelnet" in commPol:
-                if not_nan_str(commPol["commTelnet"], ["name", "adminSt"]):
-                    Telnet = cobra.model.comm.Telnet(Pol, **commPol["commTelnet"])
-                    self.config.addMo(Telnet)
-            if "commSsh" in commPol:
-                if not_nan_str(commPol["commSsh"], ["name", "adminSt"]):
-                    Ssh = cobra.model.comm.Ssh(Pol, **commPol["commSsh"])
-                    self.config.addMo(Ssh)
-            if "commHttp" in commPol:
-                if not_nan_str(commPol["commHttp"], ["name", "adminSt"]):
-                    Http = cobra.model.comm.Http(Pol, **commPol["commHttp"])
-                    self.config.addMo(Http)
-            if "commHttps" in commPol:
-                if not_nan_str(commPol["commHttps"], ["name", "adminSt"]):
-                    Https = cobra.model.comm.Https(Pol, **commPol["commHttps"])
-                    self.config.addMo(Https)
-            if "commShellinabox" in commPol:
-                if not_nan_str(commPol["commShellinabox"], ["name", "adminSt"]):
-                    Shellinabox = cobra.model.comm.Shellinabox(Pol, **commPol["commShellinabox"])
-                    self.config.addMo(Shellinabox)
-
-    def fabric_policy_switch_callhome(self, value):
-        """
-        Fabric > Fabric Policies > Policies > Switch > Callhome Inventory
-        """
-        pass
+            Pol = CommPol(Inst, **_props(commPol))
+            mos = [Pol]
+            for key, sub in commPol.items():
+                rule = rules.get(key)
+                if rule is not None and sub is not None:
+                    cls, valid = rule
+                    if valid(sub):
+                        mos.append(cls(Pol, **sub))
+            self._add_many(mos)
 
     def infraNodeP(self, value):
         """
         Fabric > Access Policies > Switches > Leaf Switches > Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Infra = self._infra()
         for infraNodeP in value:
-            NodeP = cobra.model.infra.NodeP(Infra, **infraNodeP)
-            self.config.addMo(NodeP)
-            if "infraLeafS" in infraNodeP:
-                for infraLeafS in infraNodeP["infraLeafS"]:
-                    if not_nan_str(infraLeafS, ["name"]):
-                        LeafS = cobra.model.infra.LeafS(NodeP, **infraLeafS)
-                        self.config.addMo(LeafS)
-                        if "infraNodeBlk" in infraLeafS:
-                            if not_nan_str(infraLeafS["infraNodeBlk"], ["from_"]):
-                                NodeBlk = cobra.model.infra.NodeBlk(LeafS, **infraLeafS["infraNodeBlk"])
-                                self.config.addMo(NodeBlk)
-                        if "infraRsAccNodePGrp" in infraLeafS:
-                            if not_nan_str(infraLeafS["infraRsAccNodePGrp"], ["tDn"]):
-                                RsAccNodePGrp = cobra.model.infra.RsAccNodePGrp(LeafS, **infraLeafS["infraRsAccNodePGrp"])
-                                self.config.addMo(RsAccNodePGrp)
-            if "infraRsAccPortP" in infraNodeP:
-                for infraRsAccPortP in infraNodeP["infraRsAccPortP"]:
-                    if not_nan_str(infraRsAccPortP, ["tDn"]):
-                        RsAccPortP = cobra.model.infra.RsAccPortP(NodeP, **infraRsAccPortP)
-                        self.config.addMo(RsAccPortP)
+            NodeP = InfraNodeP(Infra, **_props(infraNodeP))
+            addMo(NodeP)
+            for infraLeafS in _valid_children(infraNodeP, "infraLeafS", ("name",)):
+                LeafS = InfraLeafS(NodeP, **_props(infraLeafS))
+                addMo(LeafS)
+                if (sub := infraLeafS.get("infraNodeBlk")) is not None and not_nan_value(sub, "from_"):
+                    NodeBlk = InfraNodeBlk(LeafS, **sub)
+                    addMo(NodeBlk)
+                if (sub := infraLeafS.get("infraRsAccNodePGrp")) is not None and not_nan_value(sub, "tDn"):
+                    RsAccNodePGrp = InfraRsAccNodePGrp(LeafS, **sub)
+                    addMo(RsAccNodePGrp)
+            for infraRsAccPortP in _valid_children(infraNodeP, "infraRsAccPortP", ("tDn",)):
+                RsAccPortP = InfraRsAccPortP(NodeP, **infraRsAccPortP)
+                addMo(RsAccPortP)
 
     def infraAccNodePGrp(self, value):
         """
         Fabric > Access Policies > Switches > Leaf Switches > Policy Groups
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        FuncP = cobra.model.infra.FuncP(Infra)
+        if not value:
+            return
+        FuncP = self._infra_funcp()
+        rules = _RULES_INFRAACCNODEPGRP
         for infraAccNodePGrp in value:
-            AccNodePGrp = cobra.model.infra.AccNodePGrp(FuncP, **infraAccNodePGrp)
-            self.config.addMo(AccNodePGrp)
-            if "infraRsTopoctrlFwdScaleProfPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsTopoctrlFwdScaleProfPol"], ["tnTopoctrlFwdScaleProfilePolName"]):
-                    RsTopoctrlFwdScaleProfPol = cobra.model.infra.RsTopoctrlFwdScaleProfPol(AccNodePGrp, **infraAccNodePGrp["infraRsTopoctrlFwdScaleProfPol"])
-                    self.config.addMo(RsTopoctrlFwdScaleProfPol)
-            if "infraRsLeafTopoctrlUsbConfigProfilePol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsLeafTopoctrlUsbConfigProfilePol"], ["tnTopoctrlUsbConfigProfilePolName"]):
-                    RsLeafTopoctrlUsbConfigProfilePol = cobra.model.infra.RsLeafTopoctrlUsbConfigProfilePol(AccNodePGrp, **infraAccNodePGrp["infraRsLeafTopoctrlUsbConfigProfilePol"])
-                    self.config.addMo(RsLeafTopoctrlUsbConfigProfilePol)
-            if "infraRsLeafPGrpToLldpIfPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsLeafPGrpToLldpIfPol"], ["tnLldpIfPolName"]):
-                    RsLeafPGrpToLldpIfPol = cobra.model.infra.RsLeafPGrpToLldpIfPol(AccNodePGrp, **infraAccNodePGrp["infraRsLeafPGrpToLldpIfPol"])
-                    self.config.addMo(RsLeafPGrpToLldpIfPol)
-            if "infraRsBfdIpv6InstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsBfdIpv6InstPol"], ["tnBfdIpv6InstPolName"]):
-                    RsBfdIpv6InstPol = cobra.model.infra.RsBfdIpv6InstPol(AccNodePGrp, **infraAccNodePGrp["infraRsBfdIpv6InstPol"])
-                    self.config.addMo(RsBfdIpv6InstPol)
-            if "infraRsSynceInstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsSynceInstPol"], ["tnSynceInstPolName"]):
-                    RsSynceInstPol = cobra.model.infra.RsSynceInstPol(AccNodePGrp, **infraAccNodePGrp["infraRsSynceInstPol"])
-                    self.config.addMo(RsSynceInstPol)
-            if "infraRsPoeInstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsPoeInstPol"], ["tnPoeInstPolName"]):
-                    RsPoeInstPol = cobra.model.infra.RsPoeInstPol(AccNodePGrp, **infraAccNodePGrp["infraRsPoeInstPol"])
-                    self.config.addMo(RsPoeInstPol)
-            if "infraRsBfdMhIpv4InstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsBfdMhIpv4InstPol"], ["tnBfdMhIpv4InstPolName"]):
-                    RsBfdMhIpv4InstPol = cobra.model.infra.RsBfdMhIpv4InstPol(AccNodePGrp, **infraAccNodePGrp["infraRsBfdMhIpv4InstPol"])
-                    self.config.addMo(RsBfdMhIpv4InstPol)
-            if "infraRsBfdMhIpv6InstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsBfdMhIpv6InstPol"], ["tnBfdMhIpv6InstPolName"]):
-                    RsBfdMhIpv6InstPol = cobra.model.infra.RsBfdMhIpv6InstPol(AccNodePGrp, **infraAccNodePGrp["infraRsBfdMhIpv6InstPol"])
-                    self.config.addMo(RsBfdMhIpv6InstPol)
-            if "infraRsEquipmentFlashConfigPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsEquipmentFlashConfigPol"], ["tnEquipmentFlashConfigPolName"]):
-                    RsEquipmentFlashConfigPol = cobra.model.infra.RsEquipmentFlashConfigPol(AccNodePGrp, **infraAccNodePGrp["infraRsEquipmentFlashConfigPol"])
-                    self.config.addMo(RsEquipmentFlashConfigPol)
-            if "infraRsMonNodeInfraPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsMonNodeInfraPol"], ["tnMonInfraPolName"]):
-                    RsMonNodeInfraPol = cobra.model.infra.RsMonNodeInfraPol(AccNodePGrp, **infraAccNodePGrp["infraRsMonNodeInfraPol"])
-                    self.config.addMo(RsMonNodeInfraPol)
-            if "infraRsFcInstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsFcInstPol"], ["tnFcInstPolName"]):
-                    RsFcInstPol = cobra.model.infra.RsFcInstPol(AccNodePGrp, **infraAccNodePGrp["infraRsFcInstPol"])
-                    self.config.addMo(RsFcInstPol)
-            if "infraRsTopoctrlFastLinkFailoverInstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsTopoctrlFastLinkFailoverInstPol"], ["tnTopoctrlFastLinkFailoverInstPolName"]):
-                    RsTopoctrlFastLinkFailoverInstPol = cobra.model.infra.RsTopoctrlFastLinkFailoverInstPol(AccNodePGrp, **infraAccNodePGrp["infraRsTopoctrlFastLinkFailoverInstPol"])
-                    self.config.addMo(RsTopoctrlFastLinkFailoverInstPol)
-            if "infraRsMstInstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsMstInstPol"], ["tnStpInstPolName"]):
-                    RsMstInstPol = cobra.model.infra.RsMstInstPol(AccNodePGrp, **infraAccNodePGrp["infraRsMstInstPol"])
-                    self.config.addMo(RsMstInstPol)
-            if "infraRsFcFabricPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsFcFabricPol"], ["tnFcFabricPolName"]):
-                    RsFcFabricPol = cobra.model.infra.RsFcFabricPol(AccNodePGrp, **infraAccNodePGrp["infraRsFcFabricPol"])
-                    self.config.addMo(RsFcFabricPol)
-            if "infraRsLeafCoppProfile" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsLeafCoppProfile"], ["tnCoppLeafProfileName"]):
-                    RsLeafCoppProfile = cobra.model.infra.RsLeafCoppProfile(AccNodePGrp, **infraAccNodePGrp["infraRsLeafCoppProfile"])
-                    self.config.addMo(RsLeafCoppProfile)
-            if "infraRsIaclLeafProfile" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsIaclLeafProfile"], ["tnIaclLeafProfileName"]):
-                    RsIaclLeafProfile = cobra.model.infra.RsIaclLeafProfile(AccNodePGrp, **infraAccNodePGrp["infraRsIaclLeafProfile"])
-                    self.config.addMo(RsIaclLeafProfile)
-            if "infraRsBfdIpv4InstPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsBfdIpv4InstPol"], ["tnBfdIpv4InstPolName"]):
-                    RsBfdIpv4InstPol = cobra.model.infra.RsBfdIpv4InstPol(AccNodePGrp, **infraAccNodePGrp["infraRsBfdIpv4InstPol"])
-                    self.config.addMo(RsBfdIpv4InstPol)
-            if "infraRsL2NodeAuthPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsL2NodeAuthPol"], ["tnL2NodeAuthPolName"]):
-                    RsL2NodeAuthPol = cobra.model.infra.RsL2NodeAuthPol(AccNodePGrp, **infraAccNodePGrp["infraRsL2NodeAuthPol"])
-                    self.config.addMo(RsL2NodeAuthPol)
-            if "infraRsLeafPGrpToCdpIfPol" in infraAccNodePGrp:
-                if not_nan_str(infraAccNodePGrp["infraRsLeafPGrpToCdpIfPol"], ["tnCdpIfPolName"]):
-                    RsLeafPGrpToCdpIfPol = cobra.model.infra.RsLeafPGrpToCdpIfPol(AccNodePGrp, **infraAccNodePGrp["infraRsLeafPGrpToCdpIfPol"])
-                    self.config.addMo(RsLeafPGrpToCdpIfPol)
+            AccNodePGrp = InfraAccNodePGrp(FuncP, **_props(infraAccNodePGrp))
+            mos = [AccNodePGrp]
+            for key, sub in infraAccNodePGrp.items():
+                rule = rules.get(key)
+                if rule is not None and sub is not None:
+                    cls, valid = rule
+                    if valid(sub):
+                        mos.append(cls(AccNodePGrp, **sub))
+            self._add_many(mos)
 
     def infraSpineP(self, value):
         """
         Fabric > Access Policies > Switches > Spine Switches > Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Infra = self._infra()
         for infraSpineP in value:
-            SpineP = cobra.model.infra.SpineP(Infra, **infraSpineP)
-            self.config.addMo(SpineP)
-            if "infraSpineS" in infraSpineP:
-                for infraSpineS in infraSpineP["infraSpineS"]:
-                    SpineS = cobra.model.infra.SpineS(SpineP, **infraSpineS)
-                    self.config.addMo(SpineS)
-                    if "infraRsSpineAccNodePGrp" in infraSpineS:
-                        RsSpineAccNodePGrp = cobra.model.infra.RsSpineAccNodePGrp(SpineS, **infraSpineS["infraRsSpineAccNodePGrp"])
-                        self.config.addMo(RsSpineAccNodePGrp)
-                    if "infraNodeBlk" in infraSpineS:
-                        NodeBlk = cobra.model.infra.NodeBlk(SpineS, **infraSpineS["infraNodeBlk"])
-                        self.config.addMo(NodeBlk)
-            if "infraRsSpAccPortP" in infraSpineP:
-                RsSpAccPortP = cobra.model.infra.RsSpAccPortP(SpineP, **infraSpineP["infraRsSpAccPortP"])
-                self.config.addMo(RsSpAccPortP)
+            SpineP = InfraSpineP(Infra, **_props(infraSpineP))
+            addMo(SpineP)
+            for infraSpineS in infraSpineP.get("infraSpineS") or ():
+                SpineS = InfraSpineS(SpineP, **_props(infraSpineS))
+                addMo(SpineS)
+                if (sub := infraSpineS.get("infraRsSpineAccNodePGrp")) is not None:
+                    RsSpineAccNodePGrp = InfraRsSpineAccNodePGrp(SpineS, **sub)
+                    addMo(RsSpineAccNodePGrp)
+                if (sub := infraSpineS.get("infraNodeBlk")) is not None:
+                    NodeBlk = InfraNodeBlk(SpineS, **sub)
+                    addMo(NodeBlk)
+            if (sub := infraSpineP.get("infraRsSpAccPortP")) is not None:
+                RsSpAccPortP = InfraRsSpAccPortP(SpineP, **sub)
+                addMo(RsSpAccPortP)
 
     def infraSpineAccNodePGrp(self, value):
         """
         Fabric > Access Policies > Switches > Spine Switches > Policy Groups
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        FuncP = cobra.model.infra.FuncP(Infra)
+        if not value:
+            return
+        FuncP = self._infra_funcp()
+        rules = _RULES_INFRASPINEACCNODEPGRP
         for infraSpineAccNodePGrp in value:
-            SpineAccNodePGrp = cobra.model.infra.SpineAccNodePGrp(FuncP, **infraSpineAccNodePGrp)
-            self.config.addMo(SpineAccNodePGrp)
-            if "infraRsSpineCoppProfile" in infraSpineAccNodePGrp:
-                RsSpineCoppProfile = cobra.model.infra.RsSpineCoppProfile(SpineAccNodePGrp, **infraSpineAccNodePGrp["infraRsSpineCoppProfile"])
-                self.config.addMo(RsSpineCoppProfile)
-            if "infraRsSpineBfdIpv4InstPol" in infraSpineAccNodePGrp:
-                RsSpineBfdIpv4InstPol = cobra.model.infra.RsSpineBfdIpv4InstPol(SpineAccNodePGrp, **infraSpineAccNodePGrp["infraRsSpineBfdIpv4InstPol"])
-                self.config.addMo(RsSpineBfdIpv4InstPol)
-            if "infraRsSpineBfdIpv6InstPol" in infraSpineAccNodePGrp:
-                RsSpineBfdIpv6InstPol = cobra.model.infra.RsSpineBfdIpv6InstPol(SpineAccNodePGrp, **infraSpineAccNodePGrp["infraRsSpineBfdIpv6InstPol"])
-                self.config.addMo(RsSpineBfdIpv6InstPol)
-            if "infraRsIaclSpineProfile" in infraSpineAccNodePGrp:
-                RsIaclSpineProfile = cobra.model.infra.RsIaclSpineProfile(SpineAccNodePGrp, **infraSpineAccNodePGrp["infraRsIaclSpineProfile"])
-                self.config.addMo(RsIaclSpineProfile)
-            if "infraRsSpinePGrpToCdpIfPol" in infraSpineAccNodePGrp:
-                RsSpinePGrpToCdpIfPol = cobra.model.infra.RsSpinePGrpToCdpIfPol(SpineAccNodePGrp, **infraSpineAccNodePGrp["infraRsSpinePGrpToCdpIfPol"])
-                self.config.addMo(RsSpinePGrpToCdpIfPol)
-            if "infraRsSpinePGrpToLldpIfPol" in infraSpineAccNodePGrp:
-                RsSpinePGrpToLldpIfPol = cobra.model.infra.RsSpinePGrpToLldpIfPol(SpineAccNodePGrp, **infraSpineAccNodePGrp["infraRsSpinePGrpToLldpIfPol"])
-                self.config.addMo(RsSpinePGrpToLldpIfPol)
+            SpineAccNodePGrp = InfraSpineAccNodePGrp(FuncP, **_props(infraSpineAccNodePGrp))
+            mos = [SpineAccNodePGrp]
+            for key, sub in infraSpineAccNodePGrp.items():
+                rule = rules.get(key)
+                if rule is not None and sub is not None:
+                    cls, valid = rule
+                    if valid(sub):
+                        mos.append(cls(SpineAccNodePGrp, **sub))
+            self._add_many(mos)
 
     def infraSpAccPortP(self, value):
         """
         Fabric > Access Policies > Interfaces > Spine Interfaces > Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for infraSpAccPortP in value:
-            SpAccPortP = cobra.model.infra.SpAccPortP(Infra, **infraSpAccPortP)
-            self.config.addMo(SpAccPortP)
-            if "infraSHPortS" in infraSpAccPortP:
-                for infraSHPortS in infraSpAccPortP["infraSHPortS"]:
-                    SHPortS = cobra.model.infra.SHPortS(SpAccPortP, **infraSHPortS)
-                    self.config.addMo(SHPortS)
-                    if "infraRsSpAccGrp" in infraSHPortS:
-                        RsSpAccGrp = cobra.model.infra.RsSpAccGrp(SHPortS, **infraSHPortS["infraRsSpAccGrp"])
-                        self.config.addMo(RsSpAccGrp)
-                    if "infraPortBlk" in infraSHPortS:
-                        for infraPortBlk in infraSHPortS["infraPortBlk"]:
-                            PortBlk = cobra.model.infra.PortBlk(SHPortS, **infraPortBlk)
-                            self.config.addMo(PortBlk)
+            self._build_tree(Infra, infraSpAccPortP, _RULES_INFRASPACCPORTP)
 
     def infraSpAccPortGrp(self, value):
         """
         Fabric > Access Policies > Interfaces > Spine Interfaces > Policy Groups
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        FuncP = cobra.model.infra.FuncP(Infra)
+        if not value:
+            return
+        FuncP = self._infra_funcp()
+        rules = _RULES_INFRASPACCPORTGRP
         for infraSpAccPortGrp in value:
-            SpAccPortGrp = cobra.model.infra.SpAccPortGrp(FuncP, **infraSpAccPortGrp)
-            self.config.addMo(SpAccPortGrp)
-            if "infraRsHIfPol" in infraSpAccPortGrp:
-                RsHIfPol = cobra.model.infra.RsHIfPol(SpAccPortGrp, **infraSpAccPortGrp["infraRsHIfPol"])
-                self.config.addMo(RsHIfPol)
-            if "infraRsCdpIfPol" in infraSpAccPortGrp:
-                RsCdpIfPol = cobra.model.infra.RsCdpIfPol(SpAccPortGrp, **infraSpAccPortGrp["infraRsCdpIfPol"])
-                self.config.addMo(RsCdpIfPol)
-            if "infraRsMacsecIfPol" in infraSpAccPortGrp:
-                RsMacsecIfPol = cobra.model.infra.RsMacsecIfPol(SpAccPortGrp, **infraSpAccPortGrp["infraRsMacsecIfPol"])
-                self.config.addMo(RsMacsecIfPol)
-            if "infraRsAttEntP" in infraSpAccPortGrp:
-                RsAttEntP = cobra.model.infra.RsAttEntP(SpAccPortGrp, **infraSpAccPortGrp["infraRsAttEntP"])
-                self.config.addMo(RsAttEntP)
-            if "infraRsLinkFlapPol" in infraSpAccPortGrp:
-                RsLinkFlapPol = cobra.model.infra.RsLinkFlapPol(SpAccPortGrp, **infraSpAccPortGrp["infraRsLinkFlapPol"])
-                self.config.addMo(RsLinkFlapPol)
-            if "infraRsCoppIfPol" in infraSpAccPortGrp:
-                RsCoppIfPol = cobra.model.infra.RsCoppIfPol(SpAccPortGrp, **infraSpAccPortGrp["infraRsCoppIfPol"])
-                self.config.addMo(RsCoppIfPol)
+            SpAccPortGrp = InfraSpAccPortGrp(FuncP, **_props(infraSpAccPortGrp))
+            mos = [SpAccPortGrp]
+            for key, sub in infraSpAccPortGrp.items():
+                rule = rules.get(key)
+                if rule is not None and sub is not None:
+                    cls, valid = rule
+                    if valid(sub):
+                        mos.append(cls(SpAccPortGrp, **sub))
+            self._add_many(mos)
 
     def infraAccPortP(self, value):
         """
         Fabric > Access Policies > Interfaces > Leaf Interfaces > Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for infraAccPortP in value:
-            AccPortP = cobra.model.infra.AccPortP(Infra, **infraAccPortP)
-            self.config.addMo(AccPortP)
-            if "infraHPortS" in infraAccPortP:
-                for infraHPortS in infraAccPortP["infraHPortS"]:
-                    HPortS = cobra.model.infra.HPortS(AccPortP, **infraHPortS)
-                    self.config.addMo(HPortS)
-                    if "infraRsAccBaseGrp" in infraHPortS:
-                        if not_nan_str(infraHPortS["infraRsAccBaseGrp"], ["tDn"]):
-                            RsAccBaseGrp = cobra.model.infra.RsAccBaseGrp(HPortS, **infraHPortS["infraRsAccBaseGrp"])
-                            self.config.addMo(RsAccBaseGrp)
-                    if "infraPortBlk" in infraHPortS:
-                        for infraPortBlk in infraHPortS["infraPortBlk"]:
-                            if not_nan_str(infraPortBlk, ["fromPort"]):
-                                PortBlk = cobra.model.infra.PortBlk(HPortS, **infraPortBlk)
-                                self.config.addMo(PortBlk)
+            self._build_tree(Infra, infraAccPortP, _RULES_INFRAACCPORTP)
 
     def infraFexP(self, value):
         """
         Fabric > Access Policies > Interfaces > Leaf Interfaces > FEX Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for infraFexP in value:
-            FexP = cobra.model.infra.FexP(Infra, **infraFexP)
-            self.config.addMo(FexP)
-            if "infraHPortS" in infraFexP:
-                for infraHPortS in infraFexP["infraHPortS"]:
-                    HPortS = cobra.model.infra.HPortS(FexP, **infraHPortS)
-                    self.config.addMo(HPortS)
-                    if "infraRsAccBaseGrp" in infraHPortS:
-                        RsAccBaseGrp = cobra.model.infra.RsAccBaseGrp(HPortS, **infraHPortS["infraRsAccBaseGrp"])
-                        self.config.addMo(RsAccBaseGrp)
-                    if "infraPortBlk" in infraHPortS:
-                        for block in infraHPortS["infraPortBlk"]:
-                            PortBlk = cobra.model.infra.PortBlk(HPortS, **block)
-                            self.config.addMo(PortBlk)
-            if "infraFexBndlGrp" in infraFexP:
-                FexBndlGrp = cobra.model.infra.FexBndlGrp(FexP, **infraFexP["infraFexBndlGrp"])
-                self.config.addMo(FexBndlGrp)
+            self._build_tree(Infra, infraFexP, _RULES_INFRAFEXP)
 
     def infraAccPortGrp(self, value):
         """
         Fabric > Access Policies > Interfaces > Leaf Interfaces > Policy Groups > Access
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        FuncP = cobra.model.infra.FuncP(Infra)
+        if not value:
+            return
+        addMo = self.config.addMo
+        FuncP = self._infra_funcp()
+        rules = _RULES_INFRAACCPORTGRP
         for infraAccPortGrp in value:
-            AccPortGrp = cobra.model.infra.AccPortGrp(FuncP, **infraAccPortGrp)
-            self.config.addMo(AccPortGrp)
-            if "infraRsAttEntP" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsAttEntP"], ["tDn"]):
-                    RsAttEntP = cobra.model.infra.RsAttEntP(AccPortGrp, **infraAccPortGrp["infraRsAttEntP"])
-                    self.config.addMo(RsAttEntP)
-            if "infraRsStpIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsStpIfPol"], ["tnStpIfPolName"]):
-                    RsStpIfPol = cobra.model.infra.RsStpIfPol(AccPortGrp, **infraAccPortGrp["infraRsStpIfPol"])
-                    self.config.addMo(RsStpIfPol)
-            if "infraRsQosLlfcIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsQosLlfcIfPol"], ["tnQosLlfcIfPolName"]):
-                    RsQosLlfcIfPol = cobra.model.infra.RsQosLlfcIfPol(AccPortGrp, **infraAccPortGrp["infraRsQosLlfcIfPol"])
-                    self.config.addMo(RsQosLlfcIfPol)
-            if "infraRsQosIngressDppIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsQosIngressDppIfPol"], ["tnQosDppPolName"]):
-                    RsQosIngressDppIfPol = cobra.model.infra.RsQosIngressDppIfPol(AccPortGrp, **infraAccPortGrp["infraRsQosIngressDppIfPol"])
-                    self.config.addMo(RsQosIngressDppIfPol)
-            if "infraRsStormctrlIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsStormctrlIfPol"], ["tnStormctrlIfPolName"]):
-                    RsStormctrlIfPol = cobra.model.infra.RsStormctrlIfPol(AccPortGrp, **infraAccPortGrp["infraRsStormctrlIfPol"])
-                    self.config.addMo(RsStormctrlIfPol)
-            if "infraRsQosEgressDppIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsQosEgressDppIfPol"], ["tnQosDppPolName"]):
-                    RsQosEgressDppIfPol = cobra.model.infra.RsQosEgressDppIfPol(AccPortGrp, **infraAccPortGrp["infraRsQosEgressDppIfPol"])
-                    self.config.addMo(RsQosEgressDppIfPol)
-            if "infraRsMonIfInfraPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsMonIfInfraPol"], ["tnMonInfraPolName"]):
-                    RsMonIfInfraPol = cobra.model.infra.RsMonIfInfraPol(AccPortGrp, **infraAccPortGrp["infraRsMonIfInfraPol"])
-                    self.config.addMo(RsMonIfInfraPol)
-            if "infraRsMcpIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsMcpIfPol"], ["tnMcpIfPolName"]):
-                    RsMcpIfPol = cobra.model.infra.RsMcpIfPol(AccPortGrp, **infraAccPortGrp["infraRsMcpIfPol"])
-                    self.config.addMo(RsMcpIfPol)
-            if "infraRsMacsecIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsMacsecIfPol"], ["tnMacsecIfPolName"]):
-                    RsMacsecIfPol = cobra.model.infra.RsMacsecIfPol(AccPortGrp, **infraAccPortGrp["infraRsMacsecIfPol"])
-                    self.config.addMo(RsMacsecIfPol)
-            if "infraRsQosSdIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsQosSdIfPol"], ["tnQosSdIfPolName"]):
-                    RsQosSdIfPol = cobra.model.infra.RsQosSdIfPol(AccPortGrp, **infraAccPortGrp["infraRsQosSdIfPol"])
-                    self.config.addMo(RsQosSdIfPol)
-            if "infraRsCdpIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsCdpIfPol"], ["tnCdpIfPolName"]):
-                    RsCdpIfPol = cobra.model.infra.RsCdpIfPol(AccPortGrp, **infraAccPortGrp["infraRsCdpIfPol"])
-                    self.config.addMo(RsCdpIfPol)
-            if "infraRsL2IfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsL2IfPol"], ["tnL2IfPolName"]):
-                    RsL2IfPol = cobra.model.infra.RsL2IfPol(AccPortGrp, **infraAccPortGrp["infraRsL2IfPol"])
-                    self.config.addMo(RsL2IfPol)
-            if "infraRsQosDppIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsQosDppIfPol"], ["tnQosDppPolName"]):
-                    RsQosDppIfPol = cobra.model.infra.RsQosDppIfPol(AccPortGrp, **infraAccPortGrp["infraRsQosDppIfPol"])
-                    self.config.addMo(RsQosDppIfPol)
-            if "infraRsCoppIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsCoppIfPol"], ["tnCoppIfPolName"]):
-                    RsCoppIfPol = cobra.model.infra.RsCoppIfPol(AccPortGrp, **infraAccPortGrp["infraRsCoppIfPol"])
-                    self.config.addMo(RsCoppIfPol)
-            if "infraRsDwdmIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsDwdmIfPol"], ["tnDwdmIfPolName"]):
-                    RsDwdmIfPol = cobra.model.infra.RsDwdmIfPol(AccPortGrp, **infraAccPortGrp["infraRsDwdmIfPol"])
-                    self.config.addMo(RsDwdmIfPol)
-            if "infraRsLinkFlapPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsLinkFlapPol"], ["tnFabricLinkFlapPolName"]):
-                    RsLinkFlapPol = cobra.model.infra.RsLinkFlapPol(AccPortGrp, **infraAccPortGrp["infraRsLinkFlapPol"])
-                    self.config.addMo(RsLinkFlapPol)
-            if "infraRsLldpIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsLldpIfPol"], ["tnLldpIfPolName"]):
-                    RsLldpIfPol = cobra.model.infra.RsLldpIfPol(AccPortGrp, **infraAccPortGrp["infraRsLldpIfPol"])
-                    self.config.addMo(RsLldpIfPol)
-            if "infraRsFcIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsFcIfPol"], ["tnFcIfPolName"]):
-                    RsFcIfPol = cobra.model.infra.RsFcIfPol(AccPortGrp, **infraAccPortGrp["infraRsFcIfPol"])
-                    self.config.addMo(RsFcIfPol)
-            if "infraRsQosPfcIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsQosPfcIfPol"], ["tnQosPfcIfPolName"]):
-                    RsQosPfcIfPol = cobra.model.infra.RsQosPfcIfPol(AccPortGrp, **infraAccPortGrp["infraRsQosPfcIfPol"])
-                    self.config.addMo(RsQosPfcIfPol)
-            if "infraRsHIfPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsHIfPol"], ["tnFabricHIfPolName"]):
-                    RsHIfPol = cobra.model.infra.RsHIfPol(AccPortGrp, **infraAccPortGrp["infraRsHIfPol"])
-                    self.config.addMo(RsHIfPol)
-            if "infraRsL2PortSecurityPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsL2PortSecurityPol"], ["tnL2PortSecurityPolName"]):
-                    RsL2PortSecurityPol = cobra.model.infra.RsL2PortSecurityPol(AccPortGrp, **infraAccPortGrp["infraRsL2PortSecurityPol"])
-                    self.config.addMo(RsL2PortSecurityPol)
-            if "infraRsL2PortAuthPol" in infraAccPortGrp:
-                if not_nan_str(infraAccPortGrp["infraRsL2PortAuthPol"], ["tnL2PortAuthPolName"]):
-                    RsL2PortAuthPol = cobra.model.infra.RsL2PortAuthPol(AccPortGrp, **infraAccPortGrp["infraRsL2PortAuthPol"])
-                    self.config.addMo(RsL2PortAuthPol)
+            AccPortGrp = InfraAccPortGrp(FuncP, **_props(infraAccPortGrp))
+            for key, sub in infraAccPortGrp.items():
+                rule = rules.get(key)
+                if rule is not None and sub is not None:
+                    cls, valid = rule
+                    if valid(sub):
+                        cls(AccPortGrp, **sub)
+            # The relations attach to AccPortGrp on creation and are sent with it
+            addMo(AccPortGrp)
 
     def infraAccBndlGrp(self, value):
         """
         Fabric > Access Policies > Interfaces > Leaf Interfaces > Policy Groups > PC or VPC
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        FuncP = cobra.model.infra.FuncP(Infra)
+        if not value:
+            return
+        addMo = self.config.addMo
+        FuncP = self._infra_funcp()
+        rules = _RULES_INFRAACCBNDLGRP
         for infraAccBndlGrp in value:
-            AccBndlGrp = cobra.model.infra.AccBndlGrp(FuncP, **infraAccBndlGrp)
-            self.config.addMo(AccBndlGrp)
-            if "infraRsAttEntP" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsAttEntP"], ["tDn"]):
-                    RsAttEntP = cobra.model.infra.RsAttEntP(AccBndlGrp, **infraAccBndlGrp["infraRsAttEntP"])
-                    self.config.addMo(RsAttEntP)
-            if "infraRsStpIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsStpIfPol"], ["tnStpIfPolName"]):
-                    RsStpIfPol = cobra.model.infra.RsStpIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsStpIfPol"])
-                    self.config.addMo(RsStpIfPol)
-            if "infraRsQosLlfcIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsQosLlfcIfPol"], ["tnQosLlfcIfPolName"]):
-                    RsQosLlfcIfPol = cobra.model.infra.RsQosLlfcIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsQosLlfcIfPol"])
-                    self.config.addMo(RsQosLlfcIfPol)
-            if "infraRsQosIngressDppIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsQosIngressDppIfPol"], ["tnQosDppPolName"]):
-                    RsQosIngressDppIfPol = cobra.model.infra.RsQosIngressDppIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsQosIngressDppIfPol"])
-                    self.config.addMo(RsQosIngressDppIfPol)
-            if "infraRsStormctrlIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsStormctrlIfPol"], ["tnStormctrlIfPolName"]):
-                    RsStormctrlIfPol = cobra.model.infra.RsStormctrlIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsStormctrlIfPol"])
-                    self.config.addMo(RsStormctrlIfPol)
-            if "infraRsQosEgressDppIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsQosEgressDppIfPol"], ["tnQosDppPolName"]):
-                    RsQosEgressDppIfPol = cobra.model.infra.RsQosEgressDppIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsQosEgressDppIfPol"])
-                    self.config.addMo(RsQosEgressDppIfPol)
-            if "infraRsMonIfInfraPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsMonIfInfraPol"], ["tnMonInfraPolName"]):
-                    RsMonIfInfraPol = cobra.model.infra.RsMonIfInfraPol(AccBndlGrp, **infraAccBndlGrp["infraRsMonIfInfraPol"])
-                    self.config.addMo(RsMonIfInfraPol)
-            if "infraRsMcpIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsMcpIfPol"], ["tnMcpIfPolName"]):
-                    RsMcpIfPol = cobra.model.infra.RsMcpIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsMcpIfPol"])
-                    self.config.addMo(RsMcpIfPol)
-            if "infraRsMacsecIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsMacsecIfPol"], ["tnMacsecIfPolName"]):
-                    RsMacsecIfPol = cobra.model.infra.RsMacsecIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsMacsecIfPol"])
-                    self.config.addMo(RsMacsecIfPol)
-            if "infraRsQosSdIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsQosSdIfPol"], ["tnQosSdIfPolName"]):
-                    RsQosSdIfPol = cobra.model.infra.RsQosSdIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsQosSdIfPol"])
-                    self.config.addMo(RsQosSdIfPol)
-            if "infraRsCdpIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsCdpIfPol"], ["tnCdpIfPolName"]):
-                    RsCdpIfPol = cobra.model.infra.RsCdpIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsCdpIfPol"])
-                    self.config.addMo(RsCdpIfPol)
-            if "infraRsL2IfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsL2IfPol"], ["tnL2IfPolName"]):
-                    RsL2IfPol = cobra.model.infra.RsL2IfPol(AccBndlGrp, **infraAccBndlGrp["infraRsL2IfPol"])
-                    self.config.addMo(RsL2IfPol)
-            if "infraRsQosDppIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsQosDppIfPol"], ["tnQosDppPolName"]):
-                    RsQosDppIfPol = cobra.model.infra.RsQosDppIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsQosDppIfPol"])
-                    self.config.addMo(RsQosDppIfPol)
-            if "infraRsCoppIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsCoppIfPol"], ["tnCoppIfPolName"]):
-                    RsCoppIfPol = cobra.model.infra.RsCoppIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsCoppIfPol"])
-                    self.config.addMo(RsCoppIfPol)
-            if "infraRsLldpIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsLldpIfPol"], ["tnLldpIfPolName"]):
-                    RsLldpIfPol = cobra.model.infra.RsLldpIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsLldpIfPol"])
-                    self.config.addMo(RsLldpIfPol)
-            if "infraRsFcIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsFcIfPol"], ["tnFcIfPolName"]):
-                    RsFcIfPol = cobra.model.infra.RsFcIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsFcIfPol"])
-                    self.config.addMo(RsFcIfPol)
-            if "infraRsQosPfcIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsQosPfcIfPol"], ["tnQosPfcIfPolName"]):
-                    RsQosPfcIfPol = cobra.model.infra.RsQosPfcIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsQosPfcIfPol"])
-                    self.config.addMo(RsQosPfcIfPol)
-            if "infraRsHIfPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsHIfPol"], ["tnFabricHIfPolName"]):
-                    RsHIfPol = cobra.model.infra.RsHIfPol(AccBndlGrp, **infraAccBndlGrp["infraRsHIfPol"])
-                    self.config.addMo(RsHIfPol)
-            if "infraRsL2PortSecurityPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsL2PortSecurityPol"], ["tnL2PortSecurityPolName"]):
-                    RsL2PortSecurityPol = cobra.model.infra.RsL2PortSecurityPol(AccBndlGrp, **infraAccBndlGrp["infraRsL2PortSecurityPol"])
-                    self.config.addMo(RsL2PortSecurityPol)
-            if "infraRsL2PortAuthPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsL2PortAuthPol"], ["tnL2PortAuthPolName"]):
-                    RsL2PortAuthPol = cobra.model.infra.RsL2PortAuthPol(AccBndlGrp, **infraAccBndlGrp["infraRsL2PortAuthPol"])
-                    self.config.addMo(RsL2PortAuthPol)
-            if "infraRsLacpPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsLacpPol"], ["tnLacpLagPolName"]):
-                    RsLacpPol = cobra.model.infra.RsLacpPol(AccBndlGrp, **infraAccBndlGrp["infraRsLacpPol"])
-                    self.config.addMo(RsLacpPol)
-            if "infraRsLinkFlapPol" in infraAccBndlGrp:
-                if not_nan_str(infraAccBndlGrp["infraRsLinkFlapPol"], ["tnFabricLinkFlapPolName"]):
-                    RsLinkFlapPol = cobra.model.infra.RsLinkFlapPol(AccBndlGrp, **infraAccBndlGrp["infraRsLinkFlapPol"])
-                    self.config.addMo(RsLinkFlapPol)
+            AccBndlGrp = InfraAccBndlGrp(FuncP, **_props(infraAccBndlGrp))
+            for key, sub in infraAccBndlGrp.items():
+                rule = rules.get(key)
+                if rule is not None and sub is not None:
+                    cls, valid = rule
+                    if valid(sub):
+                        cls(AccBndlGrp, **sub)
+            # The relations attach to AccBndlGrp on creation and are sent with it
+            addMo(AccBndlGrp)
 
     def fabricProtPol(self, value):
         """
         Fabric > Access Policies > Policies > Switch > Virtual Port Channel default
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.fabric.Inst(Uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for fabricProtPol in value:
-            ProtPol = cobra.model.fabric.ProtPol(Inst, **fabricProtPol)
+            ProtPol = FabricProtPol(Inst, **_props(fabricProtPol))
             self.config.addMo(ProtPol)
-            if "fabricExplicitGEp" in fabricProtPol:
-                for fabricExplicitGEp in fabricProtPol["fabricExplicitGEp"]:
-                    ExplicitGEp = cobra.model.fabric.ExplicitGEp(ProtPol, **fabricExplicitGEp)
-                    self.config.addMo(ExplicitGEp)
-                    if "fabricRsVpcInstPol" in fabricExplicitGEp:
-                        RsVpcInstPol = cobra.model.fabric.RsVpcInstPol(ExplicitGEp, **fabricExplicitGEp["fabricRsVpcInstPol"])
-                        self.config.addMo(RsVpcInstPol)
-                    if "fabricNodePEp" in fabricExplicitGEp:
-                        for fabricNodePEp in fabricExplicitGEp["fabricNodePEp"]:
-                            NodePEp = cobra.model.fabric.NodePEp(ExplicitGEp, **fabricNodePEp)
-                            self.config.addMo(NodePEp)
+            # The children attach to ProtPol on creation and are sent with it
+            for fabricExplicitGEp in fabricProtPol.get("fabricExplicitGEp") or ():
+                ExplicitGEp = FabricExplicitGEp(ProtPol, **_props(fabricExplicitGEp))
+                if (sub := fabricExplicitGEp.get("fabricRsVpcInstPol")) is not None:
+                    FabricRsVpcInstPol(ExplicitGEp, **sub)
+                for fabricNodePEp in fabricExplicitGEp.get("fabricNodePEp") or ():
+                    FabricNodePEp(ExplicitGEp, **fabricNodePEp)
 
     def fabricHIfPol(self, value):
         """
         Fabric > Access Policies > Policies > Interface > Link Level
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for fabricHIfPol in value:
-            HIfPol = cobra.model.fabric.HIfPol(Infra, **fabricHIfPol)
+            HIfPol = FabricHIfPol(Infra, **fabricHIfPol)
             self.config.addMo(HIfPol)
 
     def qosPfcIfPol(self, value):
         """
         Fabric > Access Policies > Policies > Interface > Priority Flow Control
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for qosPfcIfPol in value:
-            PfcIfPol = cobra.model.qos.PfcIfPol(Infra, **qosPfcIfPol)
+            PfcIfPol = QosPfcIfPol(Infra, **qosPfcIfPol)
             self.config.addMo(PfcIfPol)
 
     def cdpIfPol(self, value):
         """
         Fabric > Access Policies > Policies > Interface > CDP Interface
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for cdpIfPol in value:
-            IfPol = cobra.model.cdp.IfPol(Infra, **cdpIfPol)
+            IfPol = CdpIfPol(Infra, **cdpIfPol)
             self.config.addMo(IfPol)
 
     def lldpIfPol(self, value):
         """
         Fabric > Access Policies > Policies > Interface > LLDP Interface
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for lldpIfPol in value:
-            IfPol = cobra.model.lldp.IfPol(Infra, **lldpIfPol)
+            IfPol = LldpIfPol(Infra, **lldpIfPol)
             self.config.addMo(IfPol)
 
     def lacpLagPol(self, value):
         """
         Fabric > Access Policies > Policies > Interface > Port Channel
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for lacpLagPol in value:
-            LagPol = cobra.model.lacp.LagPol(Infra, **lacpLagPol)
+            LagPol = LacpLagPol(Infra, **lacpLagPol)
             self.config.addMo(LagPol)
 
     def stpIfPol(self, value) -> None:
         """
         Fabric > Access Policies > Policies > Interface > Spanning Tree Interface
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for stpIfPol in value:
-            IfPol = cobra.model.stp.IfPol(Infra, **stpIfPol)
+            IfPol = StpIfPol(Infra, **stpIfPol)
             self.config.addMo(IfPol)
 
     def stormctrlIfPol(self, value) -> None:
         """
         Fabric > Access Policies > Policies > Interface > Storm Control
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for stormctrlIfPol in value:
-            IfPol = cobra.model.stormctrl.IfPol(Infra, **stormctrlIfPol)
+            IfPol = StormctrlIfPol(Infra, **stormctrlIfPol)
             self.config.addMo(IfPol)
 
     def mcpIfPol(self, value):
         """
         Fabric > Access Policies > Policies > Interface > MCP Interface
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for mcpIfPol in value:
-            IfPol = cobra.model.mcp.IfPol(Infra, **mcpIfPol)
+            IfPol = McpIfPol(Infra, **mcpIfPol)
             self.config.addMo(IfPol)
 
     def infraAttEntityP(self, value):
         """
         Fabric > Access Policies > Policies > Global > Attachable Access Entity Profiles
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Infra = self._infra()
         for infraAttEntityP in value:
-            AttEntityP = cobra.model.infra.AttEntityP(Infra, **infraAttEntityP)
-            self.config.addMo(AttEntityP)
-            if "infraRsDomP" in infraAttEntityP:
-                for infraRsDomP in infraAttEntityP["infraRsDomP"]:
-                    RsDomP = cobra.model.infra.RsDomP(AttEntityP, **infraRsDomP)
-                    self.config.addMo(RsDomP)
+            AttEntityP = InfraAttEntityP(Infra, **_props(infraAttEntityP))
+            addMo(AttEntityP)
+            for infraRsDomP in infraAttEntityP.get("infraRsDomP") or ():
+                RsDomP = InfraRsDomP(AttEntityP, **infraRsDomP)
+                addMo(RsDomP)
 
     def fvnsVlanInstP(self, value):
         """
         Fabric > Access Policies > Pools > VLAN
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Infra = self._infra()
         for fvnsVlanInstP in value:
-            VlanInstP = cobra.model.fvns.VlanInstP(Infra, **fvnsVlanInstP)
-            self.config.addMo(VlanInstP)
-            if "fvnsEncapBlk" in fvnsVlanInstP:
-                for fvnsEncapBlk in fvnsVlanInstP["fvnsEncapBlk"]:
-                    EncapBlk = cobra.model.fvns.EncapBlk(VlanInstP, **fvnsEncapBlk)
-                    self.config.addMo(EncapBlk)
+            VlanInstP = FvnsVlanInstP(Infra, **_props(fvnsVlanInstP))
+            addMo(VlanInstP)
+            for fvnsEncapBlk in fvnsVlanInstP.get("fvnsEncapBlk") or ():
+                EncapBlk = FvnsEncapBlk(VlanInstP, **fvnsEncapBlk)
+                addMo(EncapBlk)
 
     def physDomP(self, value):
         """
         Fabric > Access Policies > Physical and External Domains > Physical Domain
         """
-        Uni = cobra.model.pol.Uni(self.__root)
+        if not value:
+            return
+        addMo = self.config.addMo
         for physDomP in value:
-            DomP = cobra.model.phys.DomP(Uni, **physDomP)
-            self.config.addMo(DomP)
-            if "infraRsVlanNs" in physDomP:
-                RsVlanNs = cobra.model.infra.RsVlanNs(DomP, **physDomP["infraRsVlanNs"])
-                self.config.addMo(RsVlanNs)
+            DomP = PhysDomP(self.__uni, **_props(physDomP))
+            addMo(DomP)
+            if (sub := physDomP.get("infraRsVlanNs")) is not None:
+                RsVlanNs = InfraRsVlanNs(DomP, **sub)
+                addMo(RsVlanNs)
 
     def l3extDomP(self, value):
         """
         Fabric > Access Policies > Physical and External Domains > L3 Domains
         """
-        Uni = cobra.model.pol.Uni(self.__root)
+        if not value:
+            return
+        addMo = self.config.addMo
         for l3extDomP in value:
-            DomP = cobra.model.l3ext.DomP(Uni, **l3extDomP)
-            self.config.addMo(DomP)
-            if "infraRsVlanNs" in l3extDomP:
-                RsVlanNs = cobra.model.infra.RsVlanNs(DomP, **l3extDomP["infraRsVlanNs"])
-                self.config.addMo(RsVlanNs)
+            DomP = L3extDomP(self.__uni, **_props(l3extDomP))
+            addMo(DomP)
+            if (sub := l3extDomP.get("infraRsVlanNs")) is not None:
+                RsVlanNs = InfraRsVlanNs(DomP, **sub)
+                addMo(RsVlanNs)
 
     def l2extDomP(self, value):
         """
         Fabric > Access Policies > Physical and External Domains > External Bridged Domains
         """
-        Uni = cobra.model.pol.Uni(self.__root)
+        if not value:
+            return
+        addMo = self.config.addMo
         for l2extDomP in value:
-            DomP = cobra.model.l2ext.DomP(Uni, **l2extDomP)
-            self.config.addMo(DomP)
-            if "infraRsVlanNs" in l2extDomP:
-                RsVlanNs = cobra.model.infra.RsVlanNs(DomP, **l2extDomP["infraRsVlanNs"])
-                self.config.addMo(RsVlanNs)
+            DomP = L2extDomP(self.__uni, **_props(l2extDomP))
+            addMo(DomP)
+            if (sub := l2extDomP.get("infraRsVlanNs")) is not None:
+                RsVlanNs = InfraRsVlanNs(DomP, **sub)
+                addMo(RsVlanNs)
 
     def bgpInstPol(self, value) -> None:
         """
         System Settings > All Tenants
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for bgpInstPol in value:
-            InstPol = cobra.model.bgp.InstPol(Inst, **bgpInstPol)
+            InstPol = BgpInstPol(Inst, **_props(bgpInstPol))
             self.config.addMo(InstPol)
-            if "bgpAsP" in bgpInstPol:
-                if not_nan_str(bgpInstPol["bgpAsP"], ["asn"]):
-                    AsP = cobra.model.bgp.AsP(InstPol, **bgpInstPol["bgpAsP"])
-                    self.config.addMo(AsP)
-            if "bgpRRP" in bgpInstPol:
-                RRP = cobra.model.bgp.RRP(InstPol)
-                self.config.addMo(RRP)
-                for bgpRRP in bgpInstPol["bgpRRP"]:
-                    if "bgpRRNodePEp" in bgpRRP:
-                        RRNodePEp = cobra.model.bgp.RRNodePEp(RRP, **bgpRRP["bgpRRNodePEp"])
-                        self.config.addMo(RRNodePEp)
-            if "ExtRRP" in bgpInstPol:
-                ExtRRP = cobra.model.bgp.ExtRRP(InstPol)
-                for ExtRRP in bgpInstPol["ExtRRP"]:
-                    RRNodePEp = cobra.model.bgp.RRNodePEp(ExtRRP, **ExtRRP)
-                    self.config.addMo(RRNodePEp)
+            # The children attach to InstPol on creation and are sent with it
+            if (sub := bgpInstPol.get("bgpAsP")) is not None and not_nan_value(sub, "asn"):
+                BgpAsP(InstPol, **sub)
+            if (rrps := bgpInstPol.get("bgpRRP")) is not None:
+                RRP = BgpRRP(InstPol)
+                for bgpRRP in rrps:
+                    if (sub := bgpRRP.get("bgpRRNodePEp")) is not None:
+                        BgpRRNodePEp(RRP, **sub)
+            if (extrrps := bgpInstPol.get("ExtRRP")) is not None:
+                ExtRRP = BgpExtRRP(InstPol)
+                for bgpRRNodePEp in extrrps:
+                    BgpRRNodePEp(ExtRRP, **bgpRRNodePEp)
 
     def coopPol(self, value) -> None:
         """
         System Settings > COOP Group
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for coopPol in value:
-            Pol = cobra.model.coop.Pol(Inst, **coopPol)
+            Pol = CoopPol(Inst, **coopPol)
             self.config.addMo(Pol)
 
     def datetimeFormat(self, value) -> None:
         """
         System Settings > Date and Time
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for datetimeFormat in value:
-            Format = cobra.model.datetime.Format(Inst, **datetimeFormat)
+            Format = DatetimeFormat(Inst, **datetimeFormat)
             self.config.addMo(Format)
 
     def aaaFabricSec(self, value) -> None:
         """
         System Settings > Fabric Security
         """
-        UserEp = cobra.model.aaa.UserEp(self.__uni)
+        if not value:
+            return
+        UserEp = AaaUserEp(self.__uni)
         for aaaFabricSec in value:
-            FabricSec = cobra.model.aaa.FabricSec(UserEp, **aaaFabricSec)
+            FabricSec = AaaFabricSec(UserEp, **aaaFabricSec)
             self.config.addMo(FabricSec)
 
     def aaaPreLoginBanner(self, value) -> None:
         """
         System Settings > System Alias and Banners
         """
-        UserEp = cobra.model.aaa.UserEp(self.__uni)
+        if not value:
+            return
+        UserEp = AaaUserEp(self.__uni)
         for aaaPreLoginBanner in value:
-            PreLoginBanner = cobra.model.aaa.PreLoginBanner(UserEp, **aaaPreLoginBanner)
+            PreLoginBanner = AaaPreLoginBanner(UserEp, **aaaPreLoginBanner)
             self.config.addMo(PreLoginBanner)
 
     def pkiExportEncryptionKey(self, value) -> None:
         """
         System Settings > Fabric Security
         """
+        if not value:
+            return
         for pkiExportEncryptionKey in value:
-            ExportEncryptionKey = cobra.model.pki.ExportEncryptionKey(self.__uni, **pkiExportEncryptionKey)
+            ExportEncryptionKey = PkiExportEncryptionKey(self.__uni, **pkiExportEncryptionKey)
             self.config.addMo(ExportEncryptionKey)
 
     def epLoopProtectP(self, value) -> None:
         """
         System Settings > Enpoint Controls > The endpoint loop protection
         """
-        Infra = cobra.model.infra.Infra(self.__uni)
+        if not value:
+            return
+        Infra = self._infra()
         for epLoopProtectP in value:
-            LoopProtectP = cobra.model.ep.LoopProtectP(Infra, **epLoopProtectP)
+            LoopProtectP = EpLoopProtectP(Infra, **epLoopProtectP)
             self.config.addMo(LoopProtectP)
 
     def epControlP(self, value) -> None:
         """
         System Settings > Enpoint Controls > Rogue EP Control
         """
-        Infra = cobra.model.infra.Infra(self.__uni)
+        if not value:
+            return
+        Infra = self._infra()
         for epControlP in value:
-            ControlP = cobra.model.ep.ControlP(Infra, **epControlP)
+            ControlP = EpControlP(Infra, **epControlP)
             self.config.addMo(ControlP)
 
     def epIpAgingP(self, value) -> None:
         """
         System Settings > Enpoint Controls > IP Aging
         """
-        Infra = cobra.model.infra.Infra(self.__uni)
+        if not value:
+            return
+        Infra = self._infra()
         for epIpAgingP in value:
-            IpAgingP = cobra.model.ep.IpAgingP(Infra, **epIpAgingP)
+            IpAgingP = EpIpAgingP(Infra, **epIpAgingP)
             self.config.addMo(IpAgingP)
 
     def infraSetPol(self, value) -> None:
         """
         System Settings > Fabric-Wide Settings
         """
-        Infra = cobra.model.infra.Infra(self.__uni)
+        if not value:
+            return
+        Infra = self._infra()
         for infraSetPol in value:
-            SetPol = cobra.model.infra.SetPol(Infra, **infraSetPol)
+            SetPol = InfraSetPol(Infra, **infraSetPol)
             self.config.addMo(SetPol)
 
     def isisDomPol(self, value) -> None:
         """
         System Settings > ISIS Policy
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for isisDomPol in value:
-            DomPol = cobra.model.isis.DomPol(Inst, **isisDomPol)
+            DomPol = IsisDomPol(Inst, **isisDomPol)
             self.config.addMo(DomPol)
 
     def infraPortTrackPol(self, value) -> None:
         """
         System Settings > Port Tracking
         """
-        Infra = cobra.model.infra.Infra(self.__uni)
+        if not value:
+            return
+        Infra = self._infra()
         for infraPortTrackPol in value:
-            PortTrackPol = cobra.model.infra.PortTrackPol(Infra, **infraPortTrackPol)
+            PortTrackPol = InfraPortTrackPol(Infra, **infraPortTrackPol)
             self.config.addMo(PortTrackPol)
 
     def mcpInstPol(self, value) -> None:
         """
         Fabric > Access Policies > Global > MCP Instance Policy default
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
+        if not value:
+            return
+        Infra = self._infra()
         for mcpInstPol in value:
-            InstPol = cobra.model.mcp.InstPol(Infra, **mcpInstPol)
+            InstPol = McpInstPol(Infra, **mcpInstPol)
             self.config.addMo(InstPol)
 
     def fabricNodeControl(self, value) -> None:
         """
         Fabric > Fabric Policies > Policies > Monitoring > Fabric Node Controls > default
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.fabric.Inst(Uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for fabricNodeControl in value:
-            NodeControl = cobra.model.fabric.NodeControl(Inst, **fabricNodeControl)
+            NodeControl = FabricNodeControl(Inst, **fabricNodeControl)
             self.config.addMo(NodeControl)
 
     def geoSite(self, value) -> None:
         """
         Fabric > Fabric Policies > Policies > Geolocation
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Inst = cobra.model.fabric.Inst(Uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for geoSite in value:
-            Site = cobra.model.geo.Site(Inst, **geoSite)
-            self.config.addMo(Site)
-            if "geoBuilding" in geoSite:
-                for geoBuilding in geoSite["geoBuilding"]:
-                    Building = cobra.model.geo.Building(Site, **geoBuilding)
-                    self.config.addMo(Building)
-                    if "geoFloor" in geoBuilding:
-                        for geoFloor in geoBuilding["geoFloor"]:
-                            Floor = cobra.model.geo.Floor(Building, **geoFloor)
-                            self.config.addMo(Floor)
-                            if "geoRoom" in geoFloor:
-                                for geoRoom in geoFloor["geoRoom"]:
-                                    Room = cobra.model.geo.Room(Floor, **geoRoom)
-                                    self.config.addMo(Room)
-                                    if "geoRow" in geoRoom:
-                                        for geoRow in geoRoom["geoRow"]:
-                                            Row = cobra.model.geo.Row(Room, **geoRow)
-                                            self.config.addMo(Row)
-                                            if "geoRack" in geoRow:
-                                                for geoRack in geoRow["geoRack"]:
-                                                    if not_nan_str(geoRack, ["name"]):
-                                                        Rack = cobra.model.geo.Rack(Row, **geoRack)
-                                                        self.config.addMo(Rack)
-                                                        if "geoRsNodeLocation" in geoRack:
-                                                            for geoRsNodeLocation in geoRack["geoRsNodeLocation"]:
-                                                                if not_nan_str(geoRsNodeLocation, ["tDn"]):
-                                                                    RsNodeLocation = cobra.model.geo.RsNodeLocation(Rack, **geoRsNodeLocation)
-                                                                    self.config.addMo(RsNodeLocation)
+            self._build_tree(Inst, geoSite, _RULES_GEOSITE)
 
     def latencyPtpMode(self, value) -> None:
         """
         Fabric > Fabric Policies > Policies > Monitoring > Fabric Node Controls > default
         """
-        Inst = cobra.model.fabric.Inst(self.__uni)
+        if not value:
+            return
+        Inst = self._fabric_inst()
         for latencyPtpMode in value:
-            PtpMode = cobra.model.latency.PtpMode(Inst, **latencyPtpMode)
+            PtpMode = LatencyPtpMode(Inst, **latencyPtpMode)
             self.config.addMo(PtpMode)
 
     def infrazoneZoneP(self, value) -> None:
         """
         Fabric > Fabric Policies > Policies > Monitoring > Fabric Node Controls > default
         """
-        Uni = cobra.model.pol.Uni(self.__root)
-        Infra = cobra.model.infra.Infra(Uni)
-        ZoneP = cobra.model.infrazone.ZoneP(Infra, **value)
-        self.config.addMo(ZoneP)
+        if not value:
+            return
+        addMo = self.config.addMo
+        Infra = self._infra()
+        ZoneP = InfrazoneZoneP(Infra, **value)
+        addMo(ZoneP)
         for infrazoneZone in value:
-            if "Zone" in infrazoneZone:
-                Zone = cobra.model.infrazone.Zone(ZoneP, **infrazoneZone["Zone"])
-                self.config.addMo(Zone)
+            if (sub := infrazoneZone.get("Zone")) is not None:
+                Zone = InfrazoneZone(ZoneP, **sub)
+                addMo(Zone)
+
+
+# Classes accepted from the templates but not implemented yet, they all share one no-op handler
+_STUBS = (
+    "tenant_application_esg",  # Tenants > Application Profiles > Endpoint Security Groups
+    "tenant_network_l2out",  # Tenants > Networking > L2Outs
+    "tenant_network_srmpls_l3out",  # Tenants > Networking > SR-MPLS VRF L3Outs
+    "tenant_dot1q_tunnel",  # Tenants > Networking > Dot1Q Tunnels
+    "tenant_contract_standard",  # Tenants > Contracts > Standard
+    "tenant_contract_taboo",  # Tenants > Contracts > Taboos
+    "tenant_contract_imported",  # Tenants > Contracts > Imported
+    "tenant_contract_filter",  # Tenants > Contracts > Filters
+    "tenant_contract_oob",  # Tenants > Contracts > Out-Of-Band Contracts
+    "tenant_policy_protocol_bfd",  # Tenants > Policies > Protocol > BFD
+    "tenant_policy_protocol_bgp",  # Tenants > Policies > Protocol > BGP
+    "tenant_policy_protocol_qos",  # Tenants > Policies > Protocol > Custom QoS
+    "tenant_policy_protocol_dhcp",  # Tenants > Policies > Protocol > DHCP
+    "tenant_policy_protocol_dataplane",  # Tenants > Policies > Protocol > Data Plane Policing
+    "tenant_policy_protocol_eigrp",  # Tenants > Policies > Protocol > EIGRP
+    "tenant_policy_protocol_endpoint_retention",  # Tenants > Policies > Protocol > End Point Retention
+    "tenant_policy_protocol_firsthop_security",  # Tenants > Policies > Protocol > First Hop Security
+    "tenant_policy_protocol_hsrp",  # Tenants > Policies > Protocol > HSRP
+    "tenant_policy_protocol_igmp",  # Tenants > Policies > Protocol > IGMP
+    "tenant_policy_protocol_ip_sla",  # Tenants > Policies > Protocol > IP SLA
+    "tenant_policy_protocol_pbr",  # Tenants > Policies > Protocol > L4-L7 Policy-Based Redirect
+    "tenant_policy_protocol_ospf",  # Tenants > Policies > Protocol > OSPF
+    "tenant_policy_protocol_pim",  # Tenants > Policies > Protocol > PIM
+    "tenant_policy_protocol_routemap_multicast",  # Tenants > Policies > Protocol > Route Maps for Multicast
+    "tenant_policy_protocol_routemap_control",  # Tenants > Policies > Protocol > Route Maps for Route Control
+    "tenant_policy_protocol_route_tag",  # Tenants > Policies > Protocol > Route Tag
+    "tenant_policy_troubleshooting_span",  # Tenants > Policies > Troubleshooting SPAN
+    "tenant_policy_troubleshooting_traceroute",  # Tenants > Policies > Troubleshooting Traceroute
+    "tenant_policy_monitoring",  # Tenants > Policies > Monitoring
+    "tenant_policy_netflow",  # Tenants > Policies > NetFlow
+    "tenant_policy_vmm",  # Tenants > Policies > VMM
+    "tenant_service_parameter",  # Tenants > Policies > Services > L4-L7 > Service Parameters
+    "tenant_service_graph_template",  # Tenants > Policies > Services > L4-L7 > Service Graph Templates
+    "tenant_service_router_configuration",  # Tenants > Policies > Services > L4-L7 > Router Configuration
+    "tenant_service_function_profile",  # Tenants > Policies > Services > L4-L7 > Function Profiles
+    "tenant_service_devices",  # Tenants > Policies > Services > L4-L7 > Devices
+    "tenant_service_imported_device",  # Tenants > Policies > Services > L4-L7 > Imported Devices
+    "tenant_service_device_policy",  # Tenants > Policies > Services > L4-L7 > Device Selection Policies
+    "tenant_service_deployed_graph_instance",  # Tenants > Policies > Services > L4-L7 > Deployed Graph Instances
+    "tenant_service_deployed_device",  # Tenants > Policies > Services > L4-L7 > Deployed Devices
+    "tenant_service_device_manager",  # Tenants > Policies > Services > L4-L7 > Device Managers
+    "tenant_service_chassis",  # Tenants > Policies > Services > L4-L7 > Chassis
+    "tenant_node_management_epg",  # Tenants > Node Management EPGs
+    "tenant_external_management_profile",  # Tenants > External Management Network Instance Profiles
+    "tenant_node_management_address",  # Tenants > Node Management Address
+    "tenant_node_management_static",  # Tenants > Node Management Address > Static Node Management Address
+    "tenant_node_connection_group",  # Tenants > Managed Node Connectivity Groups
+    "fabric_switch_leaf_profile",  # Fabric > Fabric Policies > Switches > Leaf Switches > Profiles
+    "fabric_switch_leaf_policy_group",  # Fabric > Fabric Policies > Switches > Leaf Switches > Policy Groups
+    "fabric_switch_spine_profile",  # Fabric > Fabric Policies > Switches > Spine Switches > Profiles
+    "fabric_switch_spine_policy_group",  # Fabric > Fabric Policies > Switches > Spine Switches > Policy Groups
+    "fabric_module_leaf_profile",  # Fabric > Fabric Policies > Modules > Leaf Modules > Profiles
+    "fabric_module_leaf_policy_group",  # Fabric > Fabric Policies > Modules > Leaf Modules > Policy Groups
+    "fabric_module_spine_profile",  # Fabric > Fabric Policies > Modules > Spine Modules > Profiles
+    "fabric_module_spine_policy_group",  # Fabric > Fabric Policies > Modules > Spine Modules > Policy Groups
+    "fabric_interface_leaf_profile",  # Fabric > Fabric Policies > Interfaces > Leaf Interfaces > Profiles
+    "fabric_interface_leaf_policy_group",  # Fabric > Fabric Policies > Interfaces > Leaf Interfaces > Policy Groups
+    "fabric_interface_spine_profile",  # Fabric > Fabric Policies > Interfaces > Spine Interfaces > Profiles
+    "fabric_interface_spine_policy_group",  # Fabric > Fabric Policies > Interfaces > Spine Interfaces > Policy Groups
+    "fabric_policy_switch_callhome",  # Fabric > Fabric Policies > Policies > Switch > Callhome Inventory
+)
+
+
+def _noop(self, value) -> None:
+    """
+    Placeholder handler for the classes listed in _STUBS
+    """
+
+
+for _name in _STUBS:
+    setattr(CobraClass, _name, _noop)
+del _name
+
+# Jinja keys are dispatched through this table instead of getattr() on every key
+CobraClass._HANDLERS = MappingProxyType({name: handler for name, handler in vars(CobraClass).items() if callable(handler) and not name.startswith("_") and name != "render"})
 
 
 def not_nan_str(value: Mapping[str, Any], keys: Iterable[str]) -> bool:
@@ -1866,15 +1857,21 @@ def not_nan_str(value: Mapping[str, Any], keys: Iterable[str]) -> bool:
     :param keys: Iterable of keys to check in the mapping
     :return: True if all existing keys have valid values, False otherwise
     """
+    get = value.get
+    for k in keys:
+        v = get(k, _MISSING)
+        if v is not _MISSING and _is_invalid(v):
+            return False
+    return True
+
+
+def not_nan_value(value: Mapping[str, Any], key: str) -> bool:
+    """
+    Single-key form of not_nan_str(), for the call sites that only validate one key.
 
-    def is_invalid(v: Any) -> bool:
-        if v is None:
-            return True
-        if isinstance(v, str):
-            v = v.strip()
-            return not v or v.lower() == "nan"
-        if isinstance(v, float):
-            return isnan(v)
-        return False
-
-    return not any(is_invalid(value[k]) for k in keys if k in value)
+    :param value: Mapping (dict-like) object to validate
+    :param key: Key to check in the mapping
+    :return: True if the key is missing or holds a valid value, False otherwise
+    """
+    v = value.get(key, _MISSING)
+    return v is _MISSING or not _is_invalid(v)
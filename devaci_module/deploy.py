@@ -8,54 +8,58 @@
 
 """ACI module configuration for the ACI Python SDK (cobra)."""
 
+import re
 import urllib3
 import json
 import sys
 import time
 import pandas as pd
-import xml.dom.minidom
 import cobra.mit.session
 import cobra.mit.access
 import cobra.mit.request
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from datetime import datetime
 from pathlib import Path
 import rich
 from rich.syntax import Syntax
-from .jinja import JinjaClass
+from .jinja import JinjaClass, precompile
 from .cobra import CobraClass
-import threading
+from ._ansi import RED, GREEN, WHITE, YELLOW, CYAN, RESET, HIDE_CURSOR, SHOW_CURSOR
 import warnings
 import getpass
 
+# Optional Rust-backed XLSX reader, pandas only accepts engine="calamine" from 2.2 on and falls back to openpyxl otherwise
+_PANDAS_VERSION = tuple(int(part) for part in re.findall(r"\d+", pd.__version__)[:2])
+_EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) and find_spec("python_calamine") else None
+
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # ------------------------------------------   Deployer Result Class
 
 
-RED = "\033[31;1m"
-GREEN = "\033[32;1m"
-WHITE = "\033[37;1m"
-YELLOW = "\033[33;1m"
-MAGENTA = "\033[35;1m"
-CYAN = "\033[36;1m"
-RESET = "\033[0m"
-HIDE_CURSOR = "\033[?25l"
-SHOW_CURSOR = "\033[?25h"
-
-
 class DeployResult:
     """
     The DeployResult class return the results for Deployer logs
     """
 
+    __slots__ = ("_created", "_date", "_success", "_log", "_path", "_name")
+
     def __init__(self):
-        self.date = datetime.now().strftime("%d/%m/%Y-%H:%M:%S")
+        self._created = datetime.now()
+        self._date = None
         self._success = False
         self._log = []
         self._path = Path("/")
         self._name = "template"
 
+    @property
+    def date(self) -> str:
+        if self._date is None:
+            self._date = self._created.strftime("%d/%m/%Y-%H:%M:%S")
+        return self._date
+
     @property
     def success(self) -> bool:
         return self._success
@@ -133,8 +137,10 @@ class DeployClass:
     - secure (bool): Verify SSL certificates (default: False)
     - render_to_xml (bool): Render output as XML instead of JSON (default: True)
     - working_folder (Path): Base directory for templates and data files
-    - logging_output (str): Logging filename (default: "logging.json")
+    - logging_output (str): Logging filename (default: "logging.json"), a ".ndjson" name streams one result per line
     - logging (bool): Enable execution logging to file
+    - keep_session (bool): Stay logged in to the APIC between deploy() calls until logout() (default: False)
+    - csv_engine (str): pandas CSV parser, e.g. "pyarrow" with the pyarrow extra installed (default: None, pandas' C parser)
     """
 
     def __init__(self, **kwargs):
@@ -160,6 +166,8 @@ class DeployClass:
 
         self._url = f"https://{self._ip}" if self._ip else None
         self._timeout = kwargs.get("timeout", 180)
+        self._keep_session = kwargs.get("keep_session", False)
+        self._csv_engine = kwargs.get("csv_engine", None)
         self._secure = kwargs.get("secure", False)
         self._timer = kwargs.get("timer", 5)
         self._show_output = kwargs.get("show_output", False)
@@ -180,6 +188,7 @@ class DeployClass:
         self._cobra = CobraClass()
         self._session = cobra.mit.session.LoginSession(self._url, self._username, self.__password, self._secure, self._timeout)
         self.__modir = cobra.mit.access.MoDirectory(self._session)
+        self._logged_in = False
 
         # --------------   Input Information
         self._template: list = kwargs.get("template", [])
@@ -231,7 +240,7 @@ class DeployClass:
                 _deploy.success = False
                 _deploy.log = f"[Deploy] -> [RenderError]: Failed to render template {path.name}."
                 print(f"{YELLOW}[Deploy] -> [RenderError]: {RED}Failed to render template {path.name}.{RESET}")
-            self._results.append(_deploy.json)
+            self._append_result(_deploy.json)
 
         if self._show_output:
             self.print_output()
@@ -241,26 +250,41 @@ class DeployClass:
 
         if not self._testing and self._cobra.result.success:
             deploy = None
+            success = False
             try:
-                timer_thread = self.start_timer(f"{HIDE_CURSOR}{YELLOW}[Deploy]: {CYAN}Deploying templates to APIC [{self._ip}] in")
-                timer_thread.join()
+                self.timer(f"{HIDE_CURSOR}{YELLOW}[Deploy]: {CYAN}Deploying templates to APIC [{self._ip}] in")
                 date = datetime.now().strftime("%d/%m/%Y-%H:%M:%S")
-                self.__modir.login()
+                if not self._logged_in:
+                    self.__modir.login()
+                    self._logged_in = True
                 self.__modir.commit(self._cobra.config)
+                success = True
                 deploy = {"date": date, "success": True, "log": f"[Deploy]: Template was succesfully deployed to APIC: {self._ip}."}
-                self._results.append(deploy)
+                self._append_result(deploy)
                 print(f"{YELLOW}[Deploy]: {GREEN}Template was succesfully deployed to APIC: {self._ip}.{RESET}")
             except Exception as e:
                 deploy = {"date": date, "success": False, "log": f"[Deploy] -> [{type(e).__name__}]: Unable to deploy to APIC: {self._ip}, {str(e)}"}
-                self._results.append(deploy)
+                self._append_result(deploy)
                 print(f"{YELLOW}[Deploy] -> [{type(e).__name__}]: {RED}Unable to deploy to APIC: {self._ip}, {str(e)}{RESET}")
             finally:
                 print(f"{SHOW_CURSOR}")
-                self.__modir.logout()
+                # After a failure the session may have expired, so log in again on the next deploy()
+                if self._logged_in and (not self._keep_session or not success):
+                    self.logout()
 
         if self._logging:
             self.save_logging()
 
+    def logout(self) -> None:
+        """
+        Close the APIC session, the next deploy() logs in again
+        """
+        try:
+            self.__modir.logout()
+        except Exception as e:
+            print(f"{YELLOW}[Logout] -> [{type(e).__name__}]: {RED}Unable to log out of APIC: {self._ip}, {str(e)}{RESET}")
+        self._logged_in = False
+
     def save_output(self, name: str = "output") -> None:
         """
         Save rendered configuration output to disk in a human-readable format.
@@ -275,8 +299,7 @@ class DeployClass:
         output_path = self._working_folder / f"{name}.{suffix}"
         try:
             if self._render_to_xml:
-                dom = xml.dom.minidom.parseString(self.config)
-                content = dom.toprettyxml(indent="\t")
+                content = self._cobra.result.pretty_xml
             else:
                 content = json.dumps(self.config, indent=4, ensure_ascii=False)
             output_path.write_text(content, encoding="utf-8")
@@ -296,7 +319,7 @@ class DeployClass:
         try:
             print("\n\x1b[1m\x1b[47;1m-------------------> output.\x1b[0m")
             if self._render_to_xml:
-                content = xml.dom.minidom.parseString(self.config).toprettyxml(indent="\t")
+                content = self._cobra.result.pretty_xml
                 lexer = "xml"
             else:
                 content = json.dumps(self.config, indent=4, ensure_ascii=False)
@@ -305,17 +328,13 @@ class DeployClass:
         except Exception as e:
             print(f"\x1b[31;1m[PrintOutputError]: Error printing output! {e}\x1b[0m")
 
-    def start_timer(self, msg=""):
-        t = threading.Thread(target=self.timer, args=(msg,), daemon=True)
-        t.start()
-        return t
-
     def timer(self, msg: str = "") -> None:
         """
         Display a countdown timer with a progress bar in the terminal.
         - Uses ANSI colors for visual feedback
         - Updates the same console line in-place
         - Duration is defined by self._timer (seconds)
+        - Runs on the calling thread, the commit waits for it anyway
         """
         total = self._timer
         block = "██"
@@ -329,6 +348,23 @@ class DeployClass:
             time.sleep(1)
         print(f"{RESET}")
 
+    @property
+    def _streams_logging(self) -> bool:
+        return Path(self._logging_output).suffix == ".ndjson"
+
+    def _append_result(self, result: dict) -> None:
+        """
+        Record an execution result, NDJSON logs get it appended right away so a killed run keeps its history
+        """
+        self._results.append(result)
+        if not self._logging or not self._streams_logging:
+            return
+        try:
+            with open(self._working_folder / self._logging_output, "a", encoding="utf-8") as f:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"\x1b[31;1m[LoggingError]: {type(e).__name__}: {e}\x1b[0m")
+
     def save_logging(self) -> None:
         """
         Append execution results to a JSON log file in a defensive way.
@@ -336,9 +372,10 @@ class DeployClass:
         - Handles empty files
         - Handles corrupted / invalid JSON
         - Ensures the log structure is always a list
+        - NDJSON logs are skipped, their results were appended as they happened
         """
 
-        if not self._logging:
+        if not self._logging or self._streams_logging:
             return
         log_file: Path = Path(self._working_folder / self._logging_output).with_suffix(".json")
         history = []
@@ -410,7 +447,7 @@ class DeployClass:
         - tuple[str, str]: (template_content, template_name)
         - list[tuple[str, str]]: multiple in-memory templates
         \nStored internally as:
-        - list of (template_content, template_path)
+        - list of (template_content, template_path), compiled here so deploy() only executes them
         """
         if not value:
             return
@@ -424,11 +461,14 @@ class DeployClass:
                         raise ValueError("Template content and name must be strings")
                     path = Path(name)
                     self._template.append((content, path))
+                    precompile(content)
                 # Case 2: template loaded from file
                 elif isinstance(item, str):
                     path = self._working_folder / item
                     with open(path, "r", encoding="utf-8") as file:
-                        self._template.append((file.read(), path))
+                        content = file.read()
+                    self._template.append((content, path))
+                    precompile(content)
                 else:
                     raise ValueError("Invalid template format")
             except Exception as e:
@@ -439,16 +479,13 @@ class DeployClass:
         """
         Insert CSV files path to list of Variables
         """
-        files = [value] if isinstance(value, str) else value
-        for file in files:
-            try:
-                filters = self._filters
-                path = self._working_folder / file
-                name = path.stem
-                df = pd.read_csv(path)
-                self._variables |= {name: self.apply_filter(df, filters)}
-            except Exception as e:
-                print(f"\x1b[31;1m[CSVException]: Error loading CSV file! {e}\x1b[0m")
+        files = [value] if isinstance(value, str) else list(value or ())
+        if not files:
+            return
+        # Reads are IO bound and pandas releases the GIL while parsing, results are merged in the given order
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            for variables in executor.map(self._load_csv, files):
+                self._variables |= variables
 
     @xlsx.setter
     def xlsx(self, value) -> None:
@@ -456,26 +493,46 @@ class DeployClass:
         Load XLSX file(s), optionally extract filters, and store processed sheets as variables.
         """
         files = [value] if isinstance(value, str) else value
+        # Read serially, openpyxl parses in pure Python under the GIL and catch_warnings() is not thread-safe
         for file in files:
-            try:
-                filters = None
-                path = self._working_folder / file
-
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", message="Data Validation extension is not supported*", category=UserWarning)
-                    sheets = pd.read_excel(path, sheet_name=None)
-
-                if self._filters_source_sheet:
-                    df_filters = sheets.get(self._filters_source_sheet)
-                    if df_filters is None:
-                        raise ValueError(f"Sheet '{self._filters_source_sheet}' does not exist!")
-                    filters = df_filters.loc[df_filters[self._filters_condition_field], self._filters_output_field].tolist()
-                elif self._filters:
-                    filters = self._filters
-
-                self._variables |= {name: self.apply_filter(df, filters) for name, df in sheets.items()}
-            except Exception as e:
-                print(f"\x1b[31;1m[XLSXException]: Error loading XLSX file '{file}': {e}\x1b[0m")
+            self._variables |= self._load_xlsx(file)
+
+    def _load_csv(self, file) -> dict:
+        """
+        Read one CSV file into {file stem: filtered records}, errors are reported and yield no variables
+        """
+        try:
+            path = self._working_folder / file
+            df = pd.read_csv(path, engine=self._csv_engine)
+            return {path.stem: self.apply_filter(df, self._filters)}
+        except Exception as e:
+            print(f"\x1b[31;1m[CSVException]: Error loading CSV file! {e}\x1b[0m")
+            return {}
+
+    def _load_xlsx(self, file) -> dict:
+        """
+        Read every sheet of one XLSX file into {sheet name: filtered records}, errors are reported and yield no variables
+        """
+        try:
+            filters = None
+            path = self._working_folder / file
+
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message="Data Validation extension is not supported*", category=UserWarning)
+                sheets = pd.read_excel(path, sheet_name=None, engine=_EXCEL_ENGINE)
+
+            if self._filters_source_sheet:
+                df_filters = sheets.get(self._filters_source_sheet)
+                if df_filters is None:
+                    raise ValueError(f"Sheet '{self._filters_source_sheet}' does not exist!")
+                filters = df_filters.loc[df_filters[self._filters_condition_field], self._filters_output_field].tolist()
+            elif self._filters:
+                filters = self._filters
+
+            return {name: self.apply_filter(df, filters) for name, df in sheets.items()}
+        except Exception as e:
+            print(f"\x1b[31;1m[XLSXException]: Error loading XLSX file '{file}': {e}\x1b[0m")
+            return {}
 
     def apply_filter(self, df, filters=None):
         """
@@ -485,5 +542,7 @@ class DeployClass:
         if not filters or not column or column not in df.columns:
             return df.to_dict("records") if not filters else []
 
+        # Match the tags first, so the string checks only run on the rows that are kept
+        df = df[df[column].isin(set(filters))]
         s = df[column]
-        return df[s.notna() & s.astype(str).str.strip().ne("") & s.isin(filters)].to_dict(orient="records")
+        return df[s.notna() & s.astype(str).str.strip().ne("")].to_dict(orient="records")
@@ -1,17 +1,22 @@
 """Jinja module for the ACI Python SDK (cobra)."""
 
+from sys import intern
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from yaml.constructor import SafeConstructor
-from yaml.reader import Reader
-from yaml.scanner import Scanner
-from yaml.parser import Parser
-from yaml.composer import Composer
-from yaml.resolver import Resolver
 from yaml import load
 
+try:
+    # libyaml bindings, scanning and parsing run in C, PyYAML only exports them when libyaml is available
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseLoader
+
 import jinja2
 
+from ._ansi import RED, GREEN, YELLOW, RESET
+
 # ------------------------------------------   Safe Loader
 
 
@@ -52,25 +57,13 @@ def no_convert_float_constructor(loader, node):
     return node.value
 
 
-def replace_str_nan_with_empty(obj):
+def no_nan_str(value):
     """
-    Recursively replaces string values equal to 'nan' (case-insensitive)
-    with an empty string ("") in nested dictionaries and lists.
-
-    - Traverses arbitrarily deep dict/list structures
-    - Preserves non-string values
-    - Ignores real NaN values (float('nan')); only string "nan" is replaced
-
-    :param obj: Any Python object (dict, list, str, or other)
-    :return: Object with string 'nan' values replaced by ""
+    Return "" for "nan" strings (case-insensitive), any other value is returned unchanged
     """
-    if isinstance(obj, dict):
-        return {k: replace_str_nan_with_empty(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [replace_str_nan_with_empty(v) for v in obj]
-    if isinstance(obj, str) and obj.strip().lower() == "nan":
+    if type(value) is str and value.strip().lower() == "nan":
         return ""
-    return obj
+    return value
 
 
 class MySafeConstructor(SafeConstructor):
@@ -81,25 +74,65 @@ class MySafeConstructor(SafeConstructor):
 MySafeConstructor.add_constructor("tag:yaml.org,2002:bool", MySafeConstructor.add_bool)
 
 
-class MySafeLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
-    def __init__(self, stream):
-        Reader.__init__(self, stream)
-        Scanner.__init__(self)
-        Parser.__init__(self)
-        Composer.__init__(self)
-        SafeConstructor.__init__(self)
-        Resolver.__init__(self)
+class MySafeLoader(_BaseLoader):
+    def construct_mapping(self, node, deep=False):
+        """
+        Intern the mapping keys, so the Cobra handlers' literal key lookups compare by identity, and load "nan" values as ""
+        """
+        mapping = SafeConstructor.construct_mapping(self, node, deep=deep)
+        return {intern(k) if type(k) is str else k: no_nan_str(v) for k, v in mapping.items()}
+
+    def construct_sequence(self, node, deep=False):
+        """
+        Load "nan" list items as "", keys are left alone so two "nan" keys cannot collide on ""
+        """
+        return [no_nan_str(v) for v in SafeConstructor.construct_sequence(self, node, deep=deep)]
 
 
 MySafeLoader.add_constructor("tag:yaml.org,2002:int", no_convert_int_constructor)
 MySafeLoader.add_constructor("tag:yaml.org,2002:float", no_convert_float_constructor)
 
-for first_char, resolvers in list(MySafeLoader.yaml_implicit_resolvers.items()):
-    filtered = [r for r in resolvers if r[0] != "tag:yaml.org,2002:bool"]
-    if filtered:
-        MySafeLoader.yaml_implicit_resolvers[first_char] = filtered
-    else:
-        del MySafeLoader.yaml_implicit_resolvers[first_char]
+# A fresh dict, so dropping the bool resolver does not leak into the Resolver class PyYAML's own loaders share
+MySafeLoader.yaml_implicit_resolvers = {
+    first_char: filtered
+    for first_char, resolvers in MySafeLoader.yaml_implicit_resolvers.items()
+    if (filtered := [r for r in resolvers if r[0] != "tag:yaml.org,2002:bool"])
+}
+
+
+# ------------------------------------------   Console Messages
+
+
+_OK_FMT = f"{YELLOW}[Jinja]:{GREEN} Template %s was rendered successfully.{RESET}"
+_ERR_FMT = f"{YELLOW}[Jinja] -> [%s]:{RED} %s. Line: %s{RESET}"
+
+
+# ------------------------------------------   Jinja2 Environment
+
+
+# Shared by every JinjaClass, so the environment and its filters are set up once per process
+_ENV = jinja2.Environment(loader=jinja2.BaseLoader(), extensions=["jinja2.ext.do"], auto_reload=False)
+_ENV.filters["bool"] = str_to_bool
+_ENV.filters["range"] = range_filter
+_ENV.filters["nan"] = nan_filter
+
+
+@lru_cache(maxsize=128)
+def _compile(source: str) -> jinja2.Template:
+    """
+    Compile a template source once, later renders of the same source reuse the compiled template while it is among the 128 most recent
+    """
+    return _ENV.from_string(source)
+
+
+def precompile(source: str) -> Optional[jinja2.Template]:
+    """
+    Compile a template ahead of its first render, syntax errors are left for JinjaClass.render() to report
+    """
+    try:
+        return _compile(source)
+    except jinja2.TemplateSyntaxError:
+        return None
 
 
 class JinjaError(Exception):
@@ -122,8 +155,11 @@ class JinjaResult:
     The JinjaResult class return the results for Jinja Render
     """
 
+    __slots__ = ("_created", "_date", "_output", "_success", "_log")
+
     def __init__(self):
-        self.date = datetime.now().strftime("%d/%m/%Y-%H:%M:%S")
+        self._created = datetime.now()
+        self._date = None
         self._output = None
         self._success = False
         self._log = str()
@@ -132,6 +168,12 @@ class JinjaResult:
     def output(self) -> Optional[dict]:
         return self._output
 
+    @property
+    def date(self) -> str:
+        if self._date is None:
+            self._date = self._created.strftime("%d/%m/%Y-%H:%M:%S")
+        return self._date
+
     @property
     def success(self) -> bool:
         return self._success
@@ -180,38 +222,19 @@ class JinjaClass:
         self._template = None
         self._name = None
 
-        # --------------   Jinja2 Setup
-        self._setup = {
-            "loader": jinja2.BaseLoader(),
-            "extensions": ["jinja2.ext.do"],
-        }
-        self.env = jinja2.Environment(**self._setup)
-
-        # --------------   Jinja2 Filters
-        self.env.filters["bool"] = str_to_bool
-        self.env.filters["range"] = range_filter
-        self.env.filters["nan"] = nan_filter
-
         # --------------   Output Information
         self._result = JinjaResult()
 
     def render(self, **kwargs) -> None:
-        RED = "\033[31;1m"
-        GREEN = "\033[32;1m"
-        WHITE = "\033[37;1m"
-        YELLOW = "\033[33;1m"
-        MAGENTA = "\033[35;1m"
-        RESET = "\033[0m"
-
         try:
-            output = self.env.from_string(self._template).render(**kwargs)
-            self._result.output = replace_str_nan_with_empty(load(output, MySafeLoader))
+            output = _compile(self._template).render(**kwargs)
+            self._result.output = load(output, MySafeLoader)
             self._result.log = f"[Jinja]: Template {self._name} was rendered sucessfully."
             self._result.success = True
-            print(f"{YELLOW}[Jinja]:{GREEN} Template {self._name} was rendered successfully.{RESET}")
+            print(_OK_FMT % self._name)
         except Exception as e:
             self._result.log = f"[Jinja] -> [{type(e).__name__}]: {e.message}. Line: {e.lineno}"
-            print(f"{YELLOW}[Jinja] -> [{type(e).__name__}]:{RED} {str(e)}. Line: {e.lineno}{RESET}")
+            print(_ERR_FMT % (type(e).__name__, e, e.lineno))
 
     @property
     def template(self) -> str:
@@ -16,6 +16,11 @@ INSTALL_REQUIRES = [
     "acimodel",
 ]
 
+EXTRAS_REQUIRE = {
+    "calamine": ["python-calamine"],
+    "pyarrow": ["pyarrow"],
+}
+
 setuptools.setup(
     name="devaci_module",
     version="1.5.2",
@@ -28,6 +33,7 @@ setuptools.setup(
     url="https://github.com/cocuni80/devaci_module",
     packages=setuptools.find_packages(),
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",